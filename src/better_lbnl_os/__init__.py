@@ -14,129 +14,156 @@ __version__ = "0.1.1"
 __author__ = "Han Li"
 __email__ = "hanli@lbl.gov"
 
-# Core algorithms - pure functions
-from better_lbnl_os.core.benchmarking import (
-    benchmark_building,
-    benchmark_with_reference,
-    calculate_portfolio_statistics,
-    create_statistics_from_models,
-    get_reference_statistics,
-    list_available_reference_statistics,
-)
+import importlib
+from typing import TYPE_CHECKING
 
-# Result models from their domain-specific modules
-from better_lbnl_os.core.changepoint import (
-    ChangePointModelResult,
-    calculate_cvrmse,
-    calculate_r_squared,
-    fit_changepoint_model,
-)
-from better_lbnl_os.core.pipeline import (
-    fit_calendarized_models,
-    fit_models_from_inputs,
-    fit_models_with_auto_weather,
-    get_weather_for_bills,
-    prepare_model_data,
-    resolve_location,
-)
-from better_lbnl_os.core.recommendations import (
-    BETTER_MEASURES,
-    detect_symptoms,
-    map_symptoms_to_measures,
-    recommend_ee_measures,
-)
-from better_lbnl_os.core.savings import (
-    CombinedSavingsSummary,
-    FuelSavingsResult,
-    SavingsEstimate,
-    SavingsSummary,
-    estimate_savings,
-    estimate_savings_for_fuel,
-)
+# Static re-exports for type checkers and IDEs; runtime access goes through __getattr__
+if TYPE_CHECKING:
+    from better_lbnl_os.core.benchmarking import (
+        benchmark_building,
+        benchmark_with_reference,
+        calculate_portfolio_statistics,
+        create_statistics_from_models,
+        get_reference_statistics,
+        list_available_reference_statistics,
+    )
+    from better_lbnl_os.core.changepoint import (
+        ChangePointModelResult,
+        calculate_cvrmse,
+        calculate_r_squared,
+        fit_changepoint_model,
+    )
+    from better_lbnl_os.core.pipeline import (
+        fit_calendarized_models,
+        fit_models_from_inputs,
+        fit_models_with_auto_weather,
+        get_weather_for_bills,
+        prepare_model_data,
+        resolve_location,
+    )
+    from better_lbnl_os.core.recommendations import (
+        BETTER_MEASURES,
+        detect_symptoms,
+        map_symptoms_to_measures,
+        recommend_ee_measures,
+    )
+    from better_lbnl_os.core.savings import (
+        CombinedSavingsSummary,
+        FuelSavingsResult,
+        SavingsEstimate,
+        SavingsSummary,
+        estimate_savings,
+        estimate_savings_for_fuel,
+    )
+    from better_lbnl_os.core.services import (
+        BuildingAnalyticsService,
+        PortfolioBenchmarkService,
+    )
+    from better_lbnl_os.models import (
+        BuildingData,
+        CalendarizedData,
+        EnergyAggregation,
+        FuelAggregation,
+        UtilityBillData,
+        WeatherData,
+        WeatherSeries,
+    )
+    from better_lbnl_os.models.benchmarking import (
+        BenchmarkResult,
+        BenchmarkStatistics,
+        CoefficientBenchmarkResult,
+        EnergyTypeBenchmarkResult,
+    )
+    from better_lbnl_os.models.recommendations import (
+        EEMeasureRecommendation,
+        EERecommendationResult,
+        InefficiencySymptom,
+    )
 
-# Services for orchestration
-from better_lbnl_os.core.services import (
-    BuildingAnalyticsService,
-    PortfolioBenchmarkService,
-)
+# Public names are imported on first access (PEP 562) so that
+# ``import better_lbnl_os`` does not pull in pandas/scipy/matplotlib up front.
+_LAZY_IMPORTS: dict[str, tuple[str, ...]] = {
+    # Core algorithms - pure functions
+    "better_lbnl_os.core.benchmarking": (
+        "benchmark_building",
+        "benchmark_with_reference",
+        "calculate_portfolio_statistics",
+        "create_statistics_from_models",
+        "get_reference_statistics",
+        "list_available_reference_statistics",
+    ),
+    # Result models from their domain-specific modules
+    "better_lbnl_os.core.changepoint": (
+        "ChangePointModelResult",
+        "calculate_cvrmse",
+        "calculate_r_squared",
+        "fit_changepoint_model",
+    ),
+    "better_lbnl_os.core.pipeline": (
+        "fit_calendarized_models",
+        "fit_models_from_inputs",
+        "fit_models_with_auto_weather",
+        "get_weather_for_bills",
+        "prepare_model_data",
+        "resolve_location",
+    ),
+    "better_lbnl_os.core.recommendations": (
+        "BETTER_MEASURES",
+        "detect_symptoms",
+        "map_symptoms_to_measures",
+        "recommend_ee_measures",
+    ),
+    "better_lbnl_os.core.savings": (
+        "CombinedSavingsSummary",
+        "FuelSavingsResult",
+        "SavingsEstimate",
+        "SavingsSummary",
+        "estimate_savings",
+        "estimate_savings_for_fuel",
+    ),
+    # Services for orchestration
+    "better_lbnl_os.core.services": (
+        "BuildingAnalyticsService",
+        "PortfolioBenchmarkService",
+    ),
+    # Domain models with behavior (new stable path)
+    "better_lbnl_os.models": (
+        "BuildingData",
+        "CalendarizedData",
+        "EnergyAggregation",
+        "FuelAggregation",
+        "UtilityBillData",
+        "WeatherData",
+        "WeatherSeries",
+    ),
+    "better_lbnl_os.models.benchmarking": (
+        "BenchmarkResult",
+        "BenchmarkStatistics",
+        "CoefficientBenchmarkResult",
+        "EnergyTypeBenchmarkResult",
+    ),
+    "better_lbnl_os.models.recommendations": (
+        "EEMeasureRecommendation",
+        "EERecommendationResult",
+        "InefficiencySymptom",
+    ),
+}
 
-# Domain models with behavior (new stable path)
-from better_lbnl_os.models import (
-    BuildingData,
-    CalendarizedData,
-    EnergyAggregation,
-    FuelAggregation,
-    UtilityBillData,
-    WeatherData,
-    WeatherSeries,
-)
-from better_lbnl_os.models.benchmarking import (
-    BenchmarkResult,
-    BenchmarkStatistics,
-    CoefficientBenchmarkResult,
-    EnergyTypeBenchmarkResult,
-)
-from better_lbnl_os.models.recommendations import (
-    EEMeasureRecommendation,
-    EERecommendationResult,
-    InefficiencySymptom,
-)
+_LAZY: dict[str, str] = {name: module for module, names in _LAZY_IMPORTS.items() for name in names}
+_PUBLIC = frozenset(_LAZY)
 
-__all__ = [
-    "BETTER_MEASURES",
-    # Benchmarking models
-    "BenchmarkResult",
-    "BenchmarkStatistics",
-    # Services
-    "BuildingAnalyticsService",
-    # Domain models
-    "BuildingData",
-    # Calendarized models
-    "CalendarizedData",
-    # Result models
-    "ChangePointModelResult",
-    "CoefficientBenchmarkResult",
-    "CombinedSavingsSummary",
-    "EEMeasureRecommendation",
-    "EERecommendationResult",
-    "EnergyAggregation",
-    "EnergyTypeBenchmarkResult",
-    "FuelAggregation",
-    "FuelSavingsResult",
-    # Recommendation models
-    "InefficiencySymptom",
-    "PortfolioBenchmarkService",
-    "SavingsEstimate",
-    "SavingsSummary",
-    "UtilityBillData",
-    "WeatherData",
-    "WeatherSeries",
-    "__author__",
-    "__email__",
-    # Version info
-    "__version__",
-    # Benchmarking algorithms
-    "benchmark_building",
-    "benchmark_with_reference",
-    "calculate_cvrmse",
-    "calculate_portfolio_statistics",
-    "calculate_r_squared",
-    "create_statistics_from_models",
-    # Recommendation algorithms
-    "detect_symptoms",
-    "estimate_savings",
-    "estimate_savings_for_fuel",
-    "fit_calendarized_models",
-    # Core algorithms
-    "fit_changepoint_model",
-    "fit_models_from_inputs",
-    "fit_models_with_auto_weather",
-    "get_reference_statistics",
-    "get_weather_for_bills",
-    "list_available_reference_statistics",
-    "map_symptoms_to_measures",
-    # Pipeline helpers
-    "prepare_model_data",
-    "recommend_ee_measures",
-    "resolve_location",
-]
+
+def __getattr__(name: str):
+    if name not in _PUBLIC:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+# Derived from the lazy table so the export list cannot drift from what resolves
+__all__ = ("__author__", "__email__", "__version__", *_LAZY)
@@ -0,0 +1,25 @@
+"""Optional numba support.
+
+numba is an optional dependency (``pip install better-lbnl-os[fast]``). Kernel
+modules import ``njit`` and ``prange`` from here and branch on
+``NUMBA_AVAILABLE`` to use a NumPy implementation when it is missing. The
+fallback ``njit`` is a no-op decorator, so decorated helpers still run as plain
+Python.
+"""
+
+try:
+    from numba import njit, prange
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only when numba is missing
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for ``numba.njit`` (bare or with options/signatures)."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
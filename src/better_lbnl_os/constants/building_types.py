@@ -34,65 +34,49 @@ class BuildingSpaceType(Enum):
     @property
     def benchmark_id(self) -> str:
         """Get the benchmark identifier for this building type."""
-        return {
-            self.OFFICE: "OFFICE",
-            self.HOTEL: "HOTEL",
-            self.K12: "K12",
-            self.MULTIFAMILY_HOUSING: "MULTIFAMILY_HOUSING",
-            self.WORSHIP_FACILITY: "WORSHIP_FACILITY",
-            self.HOSPITAL: "HOSPITAL",
-            self.MUSEUM: "MUSEUM",
-            self.BANK_BRANCH: "BANK_BRANCH",
-            self.COURTHOUSE: "COURTHOUSE",
-            self.DATA_CENTER: "DATA_CENTER",
-            self.DISTRIBUTION_CENTER: "DISTRIBUTION_CENTER",
-            self.FASTFOOD_RESTAURANT: "FASTFOOD_RESTAURANT",
-            self.FINANCIAL_OFFICE: "FINANCIAL_OFFICE",
-            self.FIRE_STATION: "FIRE_STATION",
-            self.NON_REFRIGERATED_WAREHOUSE: "NON_REFRIGERATED_WAREHOUSE",
-            self.POLICE_STATION: "POLICE_STATION",
-            self.REFRIGERATED_WAREHOUSE: "REFRIGERATED_WAREHOUSE",
-            self.RETAIL_STORE: "RETAIL_STORE",
-            self.SELF_STORAGE_FACILITY: "SELF_STORAGE_FACILITY",
-            self.SENIOR_CARE_COMMUNITY: "SENIOR_CARE_COMMUNITY",
-            self.SUPERMARKET_GROCERY: "SUPERMARKET_GROCERY",
-            self.RESTAURANT: "RESTAURANT",
-            self.PUBLIC_LIBRARY: "PUBLIC_LIBRARY",
-            self.OTHER: "OTHER",
-        }[self]
+        return _BENCHMARK_ID_BY_TYPE[self]
 
     @classmethod
     def from_benchmark_id(cls, benchmark_id: str) -> "BuildingSpaceType":
         """Get BuildingSpaceType from benchmark identifier."""
-        benchmark_map = {
-            "OFFICE": cls.OFFICE,
-            "HOTEL": cls.HOTEL,
-            "K12": cls.K12,
-            "MULTIFAMILY_HOUSING": cls.MULTIFAMILY_HOUSING,
-            "WORSHIP_FACILITY": cls.WORSHIP_FACILITY,
-            "HOSPITAL": cls.HOSPITAL,
-            "MUSEUM": cls.MUSEUM,
-            "BANK_BRANCH": cls.BANK_BRANCH,
-            "COURTHOUSE": cls.COURTHOUSE,
-            "DATA_CENTER": cls.DATA_CENTER,
-            "DISTRIBUTION_CENTER": cls.DISTRIBUTION_CENTER,
-            "FASTFOOD_RESTAURANT": cls.FASTFOOD_RESTAURANT,
-            "FINANCIAL_OFFICE": cls.FINANCIAL_OFFICE,
-            "FIRE_STATION": cls.FIRE_STATION,
-            "NON_REFRIGERATED_WAREHOUSE": cls.NON_REFRIGERATED_WAREHOUSE,
-            "POLICE_STATION": cls.POLICE_STATION,
-            "REFRIGERATED_WAREHOUSE": cls.REFRIGERATED_WAREHOUSE,
-            "RETAIL_STORE": cls.RETAIL_STORE,
-            "SELF_STORAGE_FACILITY": cls.SELF_STORAGE_FACILITY,
-            "SENIOR_CARE_COMMUNITY": cls.SENIOR_CARE_COMMUNITY,
-            "SUPERMARKET_GROCERY": cls.SUPERMARKET_GROCERY,
-            "RESTAURANT": cls.RESTAURANT,
-            "PUBLIC_LIBRARY": cls.PUBLIC_LIBRARY,
-            "OTHER": cls.OTHER,
-        }
-        if benchmark_id not in benchmark_map:
+        if benchmark_id not in _TYPE_BY_BENCHMARK_ID:
             raise ValueError(f"Unknown benchmark ID: {benchmark_id}")
-        return benchmark_map[benchmark_id]
+        return _TYPE_BY_BENCHMARK_ID[benchmark_id]
+
+
+# Lookup tables built once at import; the enum members cannot reference them in
+# the class body, so they live at module level.
+_BENCHMARK_ID_BY_TYPE: dict[BuildingSpaceType, str] = {
+    BuildingSpaceType.OFFICE: "OFFICE",
+    BuildingSpaceType.HOTEL: "HOTEL",
+    BuildingSpaceType.K12: "K12",
+    BuildingSpaceType.MULTIFAMILY_HOUSING: "MULTIFAMILY_HOUSING",
+    BuildingSpaceType.WORSHIP_FACILITY: "WORSHIP_FACILITY",
+    BuildingSpaceType.HOSPITAL: "HOSPITAL",
+    BuildingSpaceType.MUSEUM: "MUSEUM",
+    BuildingSpaceType.BANK_BRANCH: "BANK_BRANCH",
+    BuildingSpaceType.COURTHOUSE: "COURTHOUSE",
+    BuildingSpaceType.DATA_CENTER: "DATA_CENTER",
+    BuildingSpaceType.DISTRIBUTION_CENTER: "DISTRIBUTION_CENTER",
+    BuildingSpaceType.FASTFOOD_RESTAURANT: "FASTFOOD_RESTAURANT",
+    BuildingSpaceType.FINANCIAL_OFFICE: "FINANCIAL_OFFICE",
+    BuildingSpaceType.FIRE_STATION: "FIRE_STATION",
+    BuildingSpaceType.NON_REFRIGERATED_WAREHOUSE: "NON_REFRIGERATED_WAREHOUSE",
+    BuildingSpaceType.POLICE_STATION: "POLICE_STATION",
+    BuildingSpaceType.REFRIGERATED_WAREHOUSE: "REFRIGERATED_WAREHOUSE",
+    BuildingSpaceType.RETAIL_STORE: "RETAIL_STORE",
+    BuildingSpaceType.SELF_STORAGE_FACILITY: "SELF_STORAGE_FACILITY",
+    BuildingSpaceType.SENIOR_CARE_COMMUNITY: "SENIOR_CARE_COMMUNITY",
+    BuildingSpaceType.SUPERMARKET_GROCERY: "SUPERMARKET_GROCERY",
+    BuildingSpaceType.RESTAURANT: "RESTAURANT",
+    BuildingSpaceType.PUBLIC_LIBRARY: "PUBLIC_LIBRARY",
+    BuildingSpaceType.OTHER: "OTHER",
+}
+_TYPE_BY_BENCHMARK_ID: dict[str, BuildingSpaceType] = {
+    benchmark_id: building_type for building_type, benchmark_id in _BENCHMARK_ID_BY_TYPE.items()
+}
+_TYPE_BY_VALUE: dict[str, BuildingSpaceType] = {bt.value: bt for bt in BuildingSpaceType}
+_TYPE_BY_NAME: dict[str, BuildingSpaceType] = {bt.name: bt for bt in BuildingSpaceType}
 
 
 def space_type_to_benchmark_category(space_type: str) -> BuildingSpaceType:
@@ -122,19 +106,15 @@ def space_type_to_benchmark_category(space_type: str) -> BuildingSpaceType:
     normalized = space_type.strip()
 
     # Try exact match with enum value (display name)
-    for building_type in BuildingSpaceType:
-        if building_type.value == normalized:
-            return building_type
+    building_type = _TYPE_BY_VALUE.get(normalized)
+    if building_type is not None:
+        return building_type
 
     # Try exact match with enum name
-    for building_type in BuildingSpaceType:
-        if building_type.name == normalized.upper().replace("-", "_").replace(" ", "_"):
-            return building_type
+    upper = normalized.upper()
+    building_type = _TYPE_BY_NAME.get(upper.replace("-", "_").replace(" ", "_"))
+    if building_type is not None:
+        return building_type
 
-    # Try exact match with benchmark_id
-    for building_type in BuildingSpaceType:
-        if building_type.benchmark_id == normalized.upper():
-            return building_type
-
-    # If no match found, return OTHER
-    return BuildingSpaceType.OTHER
+    # Try exact match with benchmark_id; if no match found, return OTHER
+    return _TYPE_BY_BENCHMARK_ID.get(upper, BuildingSpaceType.OTHER)
@@ -5,6 +5,14 @@ from __future__ import annotations
 import math
 from collections.abc import Mapping
 from enum import Enum
+from functools import lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class FuelType(str, Enum):
@@ -306,7 +314,20 @@ def _flatten_conversion_tables(
     return output
 
 
-CONVERSION_TO_KWH: dict[tuple[str, str], float] = _flatten_conversion_tables(CONVERSION_TABLES)
+# Read-only: get_conversion_factor memoizes lookups against this table
+CONVERSION_TO_KWH: Mapping[tuple[str, str], float] = MappingProxyType(
+    _flatten_conversion_tables(CONVERSION_TABLES)
+)
+
+# Dense (fuel x unit) factor table in enum declaration order. The extra trailing
+# row/column is all-NaN so unknown labels can be gathered with index -1.
+_FUEL_INDEX: dict[str, int] = {fuel.value: i for i, fuel in enumerate(FuelType)}
+_UNIT_INDEX: dict[str, int] = {unit.value: i for i, unit in enumerate(FuelUnit)}
+_FACTOR_LUT = np.full((len(_FUEL_INDEX) + 1, len(_UNIT_INDEX) + 1), np.nan)
+for (_fuel, _unit), _factor in CONVERSION_TO_KWH.items():
+    _FACTOR_LUT[_FUEL_INDEX[_fuel], _UNIT_INDEX[_unit]] = _factor
+_FACTOR_LUT.flags.writeable = False
+del _fuel, _unit, _factor
 
 
 # --- Alias dictionaries -----------------------------------------------------
@@ -481,8 +502,12 @@ def normalize_fuel_unit(value: str | None) -> str | None:
     return candidate
 
 
+@lru_cache(maxsize=256)
 def get_conversion_factor(fuel_type: str, unit: str) -> float | None:
-    """Lookup the kWh conversion factor for a (fuel, unit) pair."""
+    """Lookup the kWh conversion factor for a (fuel, unit) pair.
+
+    Results are memoized on the raw labels, so repeated lookups skip normalization.
+    """
     canonical_fuel = normalize_fuel_type(fuel_type)
     canonical_unit = normalize_fuel_unit(unit)
     if canonical_fuel is None or canonical_unit is None:
@@ -490,11 +515,69 @@ def get_conversion_factor(fuel_type: str, unit: str) -> float | None:
     return CONVERSION_TO_KWH.get((canonical_fuel, canonical_unit))
 
 
+def factor_lut() -> np.ndarray:
+    """Return the read-only kWh factor table indexed by enum position.
+
+    Rows follow ``FuelType`` and columns follow ``FuelUnit`` declaration order;
+    pairs without a conversion factor are NaN.
+    """
+    return _FACTOR_LUT[:-1, :-1]
+
+
+def convert_to_kwh(
+    df: pd.DataFrame,
+    fuel_col: str,
+    unit_col: str,
+    qty_col: str,
+    conversion_table: Mapping[tuple[str, str], float] | None = None,
+) -> np.ndarray:
+    """Convert a column of quantities to kWh in one vectorized pass.
+
+    Fuel and unit labels are normalized once per distinct value, and the factors
+    are gathered from a small (fuel x unit) lookup table indexed by the
+    factorized column codes.
+
+    Args:
+        df: DataFrame holding the bill rows
+        fuel_col: Column with fuel type labels (free-form or canonical)
+        unit_col: Column with unit labels (free-form or canonical)
+        qty_col: Column with the quantities to convert
+        conversion_table: Optional (fuel, unit) -> factor mapping; defaults to
+            ``CONVERSION_TO_KWH``
+
+    Returns:
+        Array of kWh values aligned with ``df``; NaN where the (fuel, unit) pair
+        has no conversion factor
+    """
+    import pandas as pd
+
+    fuel_codes, fuels = pd.factorize(df[fuel_col], use_na_sentinel=False)
+    unit_codes, units = pd.factorize(df[unit_col], use_na_sentinel=False)
+    canonical_fuels = [normalize_fuel_type(f) for f in fuels]
+    canonical_units = [normalize_fuel_unit(u) for u in units]
+    qty = df[qty_col].to_numpy(dtype=float)
+
+    # The shared default table can use the prebuilt factor table
+    if conversion_table is None or conversion_table is CONVERSION_TO_KWH:
+        fuel_idx = np.array([_FUEL_INDEX.get(f, -1) for f in canonical_fuels], dtype=np.intp)
+        unit_idx = np.array([_UNIT_INDEX.get(u, -1) for u in canonical_units], dtype=np.intp)
+        return qty * _FACTOR_LUT[fuel_idx[fuel_codes], unit_idx[unit_codes]]
+
+    table = conversion_table
+    lut = np.array(
+        [[table.get((f, u), np.nan) for u in canonical_units] for f in canonical_fuels],
+        dtype=float,
+    ).reshape(len(canonical_fuels), len(canonical_units))
+    return qty * lut[fuel_codes, unit_codes]
+
+
 __all__ = [
     "CONVERSION_TABLES",
     "CONVERSION_TO_KWH",
     "FuelType",
     "FuelUnit",
+    "convert_to_kwh",
+    "factor_lut",
     "get_conversion_factor",
     "normalize_fuel_type",
     "normalize_fuel_unit",
@@ -9,6 +9,13 @@ SPACE_TYPE_SYNONYMS: dict[str, str] = {
     "Library": BuildingSpaceType.PUBLIC_LIBRARY.value,
 }
 
+# Precomputed lookups for normalize_space_type
+_SPACE_TYPE_VALUES = frozenset(st.value for st in BuildingSpaceType)
+# Reversed so the first synonym wins when two keys differ only by case
+_SPACE_TYPE_SYNONYMS_LOWER: dict[str, str] = {
+    key.lower(): val for key, val in reversed(SPACE_TYPE_SYNONYMS.items())
+}
+
 
 def normalize_space_type(value: str) -> str:
     """Normalize a user-provided space type to a canonical display label."""
@@ -18,21 +25,20 @@ def normalize_space_type(value: str) -> str:
     upper = candidate.upper().replace(" ", "_")
     if upper in BuildingSpaceType.__members__:
         return BuildingSpaceType[upper].value
-    for st in BuildingSpaceType:
-        if candidate == st.value:
-            return st.value
+    if candidate in _SPACE_TYPE_VALUES:
+        return candidate
     if candidate in SPACE_TYPE_SYNONYMS:
         return SPACE_TYPE_SYNONYMS[candidate]
-    for key, val in SPACE_TYPE_SYNONYMS.items():
-        if candidate.lower() == key.lower():
-            return val
+    synonym = _SPACE_TYPE_SYNONYMS_LOWER.get(candidate.lower())
+    if synonym is not None:
+        return synonym
     raise ValueError(f"Space type must be one of {[st.value for st in BuildingSpaceType]}")
 
 
 def space_type_to_building_space_type(space_type_value: str) -> BuildingSpaceType:
     """Convert a space type value to BuildingSpaceType enum."""
     normalized = normalize_space_type(space_type_value)
-    for st in BuildingSpaceType:
-        if st.value == normalized:
-            return st
-    return BuildingSpaceType.OTHER
+    try:
+        return BuildingSpaceType(normalized)
+    except ValueError:
+        return BuildingSpaceType.OTHER
@@ -24,60 +24,60 @@ class BETTERTemplateConfig:
 
 
 # Template column headers for BETTER Excel (EN/FR/ES)
-BETTER_META_HEADERS = {
+BETTER_META_HEADERS: dict[str, tuple[str, ...]] = {
     # canonical -> variants (with and without asterisk)
-    "BLDG_ID": [
+    "BLDG_ID": (
         "Building ID*",
         "Building ID",
         "ID du bâtiment*",
         "ID du bâtiment",
         "Edificio ID*",
         "Edificio ID",
-    ],
-    "BLDG_NAME": [
+    ),
+    "BLDG_NAME": (
         "Building Name*",
         "Building Name",
         "Nom du bâtiment*",
         "Nom du bâtiment",
         "Nombre del edificio*",
         "Nombre del edificio",
-    ],
-    "LOCATION": [
+    ),
+    "LOCATION": (
         "Location*",
         "Location",
         "Emplacement*",
         "Emplacement",
         "Ubicación*",
         "Ubicación",
-    ],
-    "FLOOR_AREA": [
+    ),
+    "FLOOR_AREA": (
         "Gross Floor Area (Excluding Parking)*",
         "Gross Floor Area (Excluding Parking)",
         "Surface brute de plancher (hors parking)*",
         "Surface brute de plancher (hors parking)",
         "Superficie total (sin estacionamiento)*",
         "Superficie total (sin estacionamiento)",
-    ],
-    "SPACE_TYPE": [
+    ),
+    "SPACE_TYPE": (
         "Primary Building Space Type*",
         "Primary Building Space Type",
         "Type d'espace primaire du bâtiment*",
         "Type d'espace primaire du bâtiment",
         "Tipo de uso principal*",
         "Tipo de uso principal",
-    ],
+    ),
 }
 
-BETTER_BILLS_HEADERS = {
-    "BLDG_ID": [
+BETTER_BILLS_HEADERS: dict[str, tuple[str, ...]] = {
+    "BLDG_ID": (
         "Building ID*",
         "Building ID",
         "Edificio ID*",
         "Edificio ID",
         "ID du bâtiment*",
         "ID du bâtiment",
-    ],
-    "START": [
+    ),
+    "START": (
         "Billing Start Dates*",
         "Billing Start Date*",
         "Billing Start Dates",
@@ -86,8 +86,8 @@ BETTER_BILLS_HEADERS = {
         "Dates de début de facturation",
         "Fechas de inicio de facturación*",
         "Fechas de inicio de facturación",
-    ],
-    "END": [
+    ),
+    "END": (
         "Billing End Dates*",
         "Billing End Date*",
         "Billing End Dates",
@@ -96,36 +96,36 @@ BETTER_BILLS_HEADERS = {
         "Dates de fin de facturation",
         "Fechas de finalización de facturación*",
         "Fechas de finalización de facturación",
-    ],
-    "FUEL": [
+    ),
+    "FUEL": (
         "Energy Type*",
         "Energy Type",
         "Tipo de energía*",
         "Tipo de energía",
         "Type d'énergie*",
         "Type d'énergie",
-    ],
-    "UNIT": [
+    ),
+    "UNIT": (
         "Energy Unit*",
         "Energy Unit",
         "Unidad de energía*",
         "Unidad de energía",
         "Unité d'énergie*",
         "Unité d'énergie",
-    ],
-    "CONSUMPTION": [
+    ),
+    "CONSUMPTION": (
         "Energy Consumption*",
         "Energy Consumption",
         "Consumo de energía*",
         "Consumo de energía",
         "Consommation d'énergie*",
         "Consommation d'énergie",
-    ],
-    "COST": [
+    ),
+    "COST": (
         "Energy Cost",
         "Coût de l'énergie",
         "Costo de energía",
-    ],
+    ),
 }
 
 # Portfolio Manager headers
@@ -150,3 +150,27 @@ PM_BILLS_HEADERS = {
     "USAGE_QTY": "Usage/Quantity",
     "COST": "Cost ($)",
 }
+
+
+def _invert_headers(spec: dict[str, tuple[str, ...]]) -> dict[str, str]:
+    """Map each casefolded header variant to its canonical key."""
+    return {
+        variant.strip().casefold(): canonical
+        for canonical, variants in spec.items()
+        for variant in variants
+    }
+
+
+# Variant -> canonical lookups so a raw header is classified with one dict hit
+_META_INV = _invert_headers(BETTER_META_HEADERS)
+_BILLS_INV = _invert_headers(BETTER_BILLS_HEADERS)
+
+
+def canonical_meta_header(raw: str) -> str | None:
+    """Return the canonical key for a Property Information header, if recognized."""
+    return _META_INV.get(raw.strip().casefold())
+
+
+def canonical_bills_header(raw: str) -> str | None:
+    """Return the canonical key for a Utility Data header, if recognized."""
+    return _BILLS_INV.get(raw.strip().casefold())
@@ -7,16 +7,20 @@ analysis of energy consumption patterns with respect to temperature.
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
 from math import isclose
 
 import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
 from matplotlib.lines import Line2D
 from pydantic import BaseModel, Field
-from scipy import optimize, stats
+from scipy import optimize
+from scipy.special import stdtr
 
 # ChangePointModelResult defined at end of file to avoid circular imports
+from better_lbnl_os._numba_compat import NUMBA_AVAILABLE, njit
 from better_lbnl_os.constants import (
     DEFAULT_CVRMSE_THRESHOLD,
     DEFAULT_R2_THRESHOLD,
@@ -27,12 +31,23 @@ logger = logging.getLogger(__name__)
 
 # Default thresholds now sourced from data.constants
 
+# Number of fitted parameters per model type
+_MODEL_PARAMETER_COUNTS = {"1P": 1, "3P Heating": 3, "3P Cooling": 3, "5P": 5}
+
+# Below this many points a bounds sweep is cheaper than starting worker processes
+_PARALLEL_MIN_POINTS = 200
+
+# Fits of inputs up to this size are memoized on the raw array contents
+_FIT_CACHE_MAX_POINTS = 2000
+
 
 def fit_changepoint_model(
     x: np.ndarray,
     y: np.ndarray,
     min_r_squared: float = DEFAULT_R2_THRESHOLD,
     max_cv_rmse: float = DEFAULT_CVRMSE_THRESHOLD,
+    n_jobs: int = 1,
+    stop_r_squared: float | None = None,
 ) -> ChangePointModelResult:
     """Fit a change-point model to any x,y data relationship.
 
@@ -50,14 +65,65 @@ def fit_changepoint_model(
         y: Array of dependent variable values (e.g., energy_use, demand, usage)
         min_r_squared: Minimum R² threshold for model acceptance
         max_cv_rmse: Maximum CV-RMSE threshold for model acceptance
+        n_jobs: Worker processes for the change-point bounds sweep (-1 for all CPUs).
+            Inputs with fewer than 200 points are always fitted serially.
+        stop_r_squared: If set, the sweep stops at the first fit (in box order) that
+            has a significant slope and at least this R², instead of trying every
+            change-point box. Serial and parallel sweeps stop at the same box.
+            Faster, but may return a different (lower R²) fit.
 
     Returns:
         ChangePointModelResult with fitted coefficients and quality metrics
 
     Raises:
-        ValueError: If input arrays are invalid or empty
+        ValueError: If input arrays are invalid or empty, or n_jobs is not -1 or a
+            positive integer
         Exception: If model fitting fails
     """
+    if n_jobs != -1 and n_jobs < 1:
+        raise ValueError(f"n_jobs must be -1 (all CPUs) or a positive integer, got {n_jobs}")
+    x_key, y_key = _array_cache_key(x), _array_cache_key(y)
+    if x_key is None or y_key is None:
+        return _fit_changepoint_model(x, y, min_r_squared, max_cv_rmse, n_jobs, stop_r_squared)
+    # Copy so callers cannot mutate the cached result
+    result = _fit_changepoint_model_cached(
+        x_key, y_key, min_r_squared, max_cv_rmse, n_jobs, stop_r_squared
+    )
+    return result.model_copy()
+
+
+def _array_cache_key(values: np.ndarray) -> tuple | None:
+    """Hashable (dtype, shape, bytes) key for small numeric arrays, else None."""
+    if not isinstance(values, np.ndarray) or values.dtype.kind not in "biuf":
+        return None
+    if values.size > _FIT_CACHE_MAX_POINTS:
+        return None
+    return values.dtype.str, values.shape, values.tobytes()
+
+
+@lru_cache(maxsize=256)
+def _fit_changepoint_model_cached(
+    x_key: tuple,
+    y_key: tuple,
+    min_r_squared: float,
+    max_cv_rmse: float,
+    n_jobs: int,
+    stop_r_squared: float | None,
+) -> ChangePointModelResult:
+    x = np.frombuffer(x_key[2], dtype=x_key[0]).reshape(x_key[1])
+    y = np.frombuffer(y_key[2], dtype=y_key[0]).reshape(y_key[1])
+    return _fit_changepoint_model(x, y, min_r_squared, max_cv_rmse, n_jobs, stop_r_squared)
+
+
+def _fit_changepoint_model(
+    x: np.ndarray,
+    y: np.ndarray,
+    min_r_squared: float,
+    max_cv_rmse: float,
+    n_jobs: int = 1,
+    stop_r_squared: float | None = None,
+) -> ChangePointModelResult:
+    """Uncached body of ``fit_changepoint_model``."""
     # Input validation
     _validate_model_inputs(x, y)
 
@@ -69,28 +135,50 @@ def fit_changepoint_model(
         # Data is essentially constant, use 1P model (baseload only)
         return _fit_1p_model(x, y, max_cv_rmse)
 
+    # Total sum of squares is the same for every bounds box
+    ss_total = np.sum((y - y_mean) ** 2)
+    sorted_xy = _sort_by_x(x, y)
+
     # Set up bounds for model fitting
     bounds = _create_model_bounds(x, y)
 
     # Try fitting with different change-point bounds
     search_bounds = _create_changepoint_search_bounds(x, n_bins=8)
-    fit_results = []
-
-    for cp_bounds in search_bounds:
-        try:
-            # Update bounds for this iteration
-            iteration_bounds = bounds.copy()
-            iteration_bounds[0][1] = cp_bounds[0][0]  # left changepoint lower
-            iteration_bounds[1][1] = cp_bounds[0][1]  # left changepoint upper
-            iteration_bounds[0][3] = cp_bounds[1][0]  # right changepoint lower
-            iteration_bounds[1][3] = cp_bounds[1][1]  # right changepoint upper
-
-            result = _fit_model_once(x, y, iteration_bounds)
-            fit_results.append(result)
-
-        except Exception:
-            # Some bounds combinations may fail - this is expected
-            continue
+    # One (2, 5) bounds array per box with the changepoint columns (1 and 3) replaced
+    bounds_list = np.repeat(bounds[np.newaxis], len(search_bounds), axis=0)
+    bounds_list[:, :, [1, 3]] = search_bounds.transpose(0, 2, 1)
+
+    if n_jobs != 1 and len(x) >= _PARALLEL_MIN_POINTS:
+        max_workers = os.cpu_count() if n_jobs == -1 else n_jobs
+        with ProcessPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(_try_fit_model_once, x, y, box_bounds, ss_total, sorted_xy): i
+                for i, box_bounds in enumerate(bounds_list)
+            }
+            outcomes = [None] * len(bounds_list)
+            done = [False] * len(bounds_list)
+            stop_at = len(bounds_list) - 1
+            for future in as_completed(futures):
+                i = futures[future]
+                outcomes[i] = future.result()
+                done[i] = True
+                if i < stop_at and _meets_stop_criterion(outcomes[i], stop_r_squared):
+                    stop_at = i
+                # Stop once every box up to the first qualifying one is in, so the
+                # result matches the serial sweep
+                if all(done[: stop_at + 1]):
+                    break
+            for future in futures:
+                future.cancel()
+            outcomes = outcomes[: stop_at + 1]
+    else:
+        outcomes = []
+        for box_bounds in bounds_list:
+            result = _try_fit_model_once(x, y, box_bounds, ss_total, sorted_xy)
+            outcomes.append(result)
+            if _meets_stop_criterion(result, stop_r_squared):
+                break
+    fit_results = [result for result in outcomes if result is not None]
 
     if not fit_results:
         raise Exception("Could not fit any change-point model with given data")
@@ -113,67 +201,130 @@ def _validate_model_inputs(x: np.ndarray, y: np.ndarray) -> None:
         raise ValueError("Need at least 3 data points for change-point modeling")
     if all(np.isnan(x)):
         raise ValueError("x data cannot be all NaN")
+    if not (np.isfinite(x).all() and np.isfinite(y).all()):
+        raise ValueError("x and y data must be finite")
 
 
-def _create_model_bounds(x: np.ndarray, y: np.ndarray) -> list:
-    """Create bounds for model coefficient optimization."""
+def _create_model_bounds(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Create (2, 5) lower/upper bounds for model coefficient optimization."""
     left_slope_bounds = [-np.inf, 0]  # left slope (negative for energy/temperature)
     left_cp_bounds = [np.min(x), np.max(x)]  # left changepoint
     baseline_bounds = [np.min(y), np.max(y)]  # baseline value
     right_cp_bounds = [np.min(x), np.max(x)]  # right changepoint
     right_slope_bounds = [0, np.inf]  # right slope (positive for energy/temperature)
 
-    return [
+    return np.array(
         [
-            left_slope_bounds[0],
-            left_cp_bounds[0],
-            baseline_bounds[0],
-            right_cp_bounds[0],
-            right_slope_bounds[0],
+            [
+                left_slope_bounds[0],
+                left_cp_bounds[0],
+                baseline_bounds[0],
+                right_cp_bounds[0],
+                right_slope_bounds[0],
+            ],
+            [
+                left_slope_bounds[1],
+                left_cp_bounds[1],
+                baseline_bounds[1],
+                right_cp_bounds[1],
+                right_slope_bounds[1],
+            ],
         ],
+        dtype=float,
+    )
+
+
+def _create_changepoint_search_bounds(x: np.ndarray, n_bins: int = 4) -> np.ndarray:
+    """Create search bounds for left and right changepoints.
+
+    Returns an array of shape (K, 2, 2): for each bin pair ``i < j`` (in row-major
+    order) the left changepoint bounds ``(marks[i], marks[i + 1])`` and the right
+    changepoint bounds ``(marks[j], marks[j + 1])``.
+    """
+    bin_width = np.ptp(x) / n_bins
+    marks = np.min(x) + np.arange(n_bins + 1) * bin_width
+    left, right = np.triu_indices(n_bins, k=1)
+    return np.stack(
         [
-            left_slope_bounds[1],
-            left_cp_bounds[1],
-            baseline_bounds[1],
-            right_cp_bounds[1],
-            right_slope_bounds[1],
+            np.stack([marks[left], marks[left + 1]], axis=1),  # left changepoint bounds
+            np.stack([marks[right], marks[right + 1]], axis=1),  # right changepoint bounds
         ],
-    ]
+        axis=1,
+    )
 
 
-def _create_changepoint_search_bounds(x: np.ndarray, n_bins: int = 4) -> list:
-    """Create search bounds for left and right changepoints."""
-    bin_width = np.ptp(x) / n_bins
-    marks = [np.min(x) + i * bin_width for i in range(n_bins + 1)]
-
-    bounds_list = []
-    for i in range(len(marks) - 1):
-        for j in range(i + 1, len(marks) - 1):
-            bounds_list.append(
-                [
-                    (marks[i], marks[i + 1]),  # left changepoint bounds
-                    (marks[j], marks[j + 1]),  # right changepoint bounds
-                ]
-            )
+def _sort_by_x(x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Return ``x`` and ``y`` stably sorted by ``x``."""
+    order = np.argsort(x, kind="stable")
+    return x[order], y[order]
 
-    return bounds_list
+
+def _meets_stop_criterion(result: dict | None, stop_r_squared: float | None) -> bool:
+    """Whether a box fit is good enough to end the bounds sweep early."""
+    return (
+        stop_r_squared is not None
+        and result is not None
+        and result["r_squared"] >= stop_r_squared
+        and (result["heating_significant"] or result["cooling_significant"])
+    )
 
 
-def _fit_model_once(x: np.ndarray, y: np.ndarray, bounds: list) -> dict:
-    """Fit the piecewise linear model once with given bounds."""
+def _try_fit_model_once(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounds: np.ndarray,
+    ss_total: float | None = None,
+    sorted_xy: tuple[np.ndarray, np.ndarray] | None = None,
+) -> dict | None:
+    """Fit once, returning None when these bounds fail (expected for some boxes)."""
+    try:
+        return _fit_model_once(x, y, bounds, ss_total, sorted_xy)
+    except Exception:
+        return None
+
+
+def _fit_model_once(
+    x: np.ndarray,
+    y: np.ndarray,
+    bounds: np.ndarray,
+    ss_total: float | None = None,
+    sorted_xy: tuple[np.ndarray, np.ndarray] | None = None,
+) -> dict:
+    """Fit the piecewise linear model once with given bounds.
+
+    ``ss_total`` and ``sorted_xy`` (``_sort_by_x(x, y)``) may be passed in when
+    fitting many boxes against the same data.
+    """
     # Perform curve fitting
     popt, pcov = optimize.curve_fit(
-        f=piecewise_linear_5p, xdata=x, ydata=y, bounds=bounds, method="dogbox"
+        f=_make_5p_fit_function(x.size),
+        xdata=x,
+        ydata=y,
+        bounds=bounds,
+        method="dogbox",
+        jac=piecewise_linear_5p_jac,
+        check_finite=False,
+        ftol=1e-5,
+        xtol=1e-5,
+        gtol=1e-5,
     )
 
     # Calculate model quality metrics
-    y_predicted = piecewise_linear_5p(x, *popt)
-    r2 = calculate_r_squared(y, y_predicted)
-    cvrmse = calculate_cvrmse(y, y_predicted)
+    y_mean = np.mean(y)
+    if ss_total is None:
+        ss_total = np.sum((y - y_mean) ** 2)
+    ss_residuals = np.sum((y - piecewise_linear_5p(x, *popt)) ** 2)
+    r2 = _r_squared_from_ss(ss_residuals, ss_total)
+    cvrmse = _cvrmse_from_ss(ss_residuals, y_mean, y.size)
 
     # Check slope significance
-    pval_left, valid_left = _check_slope_significance(popt[0], x, y, popt, is_left_slope=True)
-    pval_right, valid_right = _check_slope_significance(popt[4], x, y, popt, is_left_slope=False)
+    x_sorted, y_sorted = _sort_by_x(x, y) if sorted_xy is None else sorted_xy
+    pval_left, valid_left = _check_slope_significance(
+        popt[0], x_sorted, y_sorted, popt, is_left_slope=True
+    )
+    pval_right, valid_right = _check_slope_significance(
+        popt[4], x_sorted, y_sorted, popt, is_left_slope=False
+    )
 
     return {
         "coefficients": popt,
@@ -190,21 +341,22 @@ def _fit_model_once(x: np.ndarray, y: np.ndarray, bounds: list) -> dict:
 def _check_slope_significance(
     slope: float, x: np.ndarray, y: np.ndarray, coefficients: np.ndarray, is_left_slope: bool
 ) -> tuple[float | None, bool]:
-    """Check if a left or right slope is statistically significant."""
+    """Check if a left or right slope is statistically significant.
+
+    ``x`` must be sorted ascending (with ``y`` in matching order) so the points on
+    each side of the change point are a prefix or suffix slice.
+    """
     if isclose(slope, 0, abs_tol=1e-5):
         return None, False
 
     if is_left_slope:
-        # Check left slope significance
-        changepoint = coefficients[1]
-        mask = x <= changepoint
+        # Check left slope significance: points with x <= changepoint
+        split = np.searchsorted(x, coefficients[1], side="right")
+        x_subset, y_subset = x[:split], y[:split]
     else:
-        # Check right slope significance
-        changepoint = coefficients[3]
-        mask = x >= changepoint
-
-    x_subset = x[mask]
-    y_subset = y[mask]
+        # Check right slope significance: points with x >= changepoint
+        split = np.searchsorted(x, coefficients[3], side="left")
+        x_subset, y_subset = x[split:], y[split:]
 
     if len(x_subset) <= 2:
         return np.inf, False
@@ -230,7 +382,9 @@ def _calculate_slope_pvalue(
 
     # Calculate t-statistic and p-value
     t_statistic = slope / standard_error
-    pvalue = stats.t.sf(np.abs(t_statistic), len(x_data) - 1) * 2  # two-tailed test
+    # Two-tailed test; stdtr(df, -|t|) is the Student-t survival function that
+    # stats.t.sf evaluates, without the distribution-object overhead
+    pvalue = stdtr(len(x_data) - 1, -np.abs(t_statistic)) * 2
 
     return pvalue
 
@@ -239,49 +393,37 @@ def _select_optimal_model(
     fit_results: list, x: np.ndarray, y: np.ndarray, min_r_squared: float, max_cv_rmse: float
 ) -> ChangePointModelResult:
     """Select the optimal model from fit results and determine model type."""
-    # Convert results to DataFrame for easier analysis
-    rows = []
-    for result in fit_results:
-        coeff = result["coefficients"]
-        row = [
-            coeff[0],
-            coeff[1],
-            coeff[2],
-            coeff[3],
-            coeff[4],  # coefficients
-            result["r_squared"],
-            result["cvrmse"],
-            result["heating_pvalue"],
-            result["cooling_pvalue"],
-            result["heating_significant"],
-            result["cooling_significant"],
-        ]
-        rows.append(row)
-
-    df_fits = pd.DataFrame(
-        rows,
-        columns=[
-            "heating_slope",
-            "heating_changepoint",
-            "baseload",
-            "cooling_changepoint",
-            "cooling_slope",
-            "r_squared",
-            "cvrmse",
-            "heating_pvalue",
-            "cooling_pvalue",
-            "heating_significant",
-            "cooling_significant",
-        ],
-    )
+    # A p-value column holding any number reports missing entries as NaN
+    missing_pvalue = {
+        key: np.nan if any(result[key] is not None for result in fit_results) else None
+        for key in ("heating_pvalue", "cooling_pvalue")
+    }
 
     # Filter for models with at least one significant slope
-    df_significant = df_fits[(df_fits["heating_significant"]) | (df_fits["cooling_significant"])]
+    significant = [
+        result
+        for result in fit_results
+        if result["heating_significant"] or result["cooling_significant"]
+    ]
 
-    if len(df_significant) > 0:
-        # Select model with highest R²
-        best_idx = df_significant["r_squared"].idxmax()
-        best_model = df_significant.loc[best_idx]
+    if significant:
+        # Select model with highest R² (first one on ties, ignoring NaN)
+        r_squared = np.array([result["r_squared"] for result in significant], dtype=float)
+        best = significant[int(np.nanargmax(r_squared))]
+        coeff = best["coefficients"]
+        best_model = {
+            "heating_slope": coeff[0],
+            "heating_changepoint": coeff[1],
+            "baseload": coeff[2],
+            "cooling_changepoint": coeff[3],
+            "cooling_slope": coeff[4],
+            "r_squared": best["r_squared"],
+            "cvrmse": best["cvrmse"],
+            "heating_significant": best["heating_significant"],
+            "cooling_significant": best["cooling_significant"],
+        }
+        for key, missing in missing_pvalue.items():
+            best_model[key] = missing if best[key] is None else best[key]
 
         # Determine model type and validate
         model_type, coefficients = _determine_model_type(best_model, x, y, min_r_squared)
@@ -305,7 +447,7 @@ def _select_optimal_model(
 
 
 def _determine_model_type(
-    model_row: pd.Series, x: np.ndarray, y: np.ndarray, min_r_squared: float
+    model_row: dict, x: np.ndarray, y: np.ndarray, min_r_squared: float
 ) -> tuple[str, dict]:
     """Determine model type (5P, 3P, etc.) and extract coefficients."""
     heating_significant = model_row["heating_significant"]
@@ -390,7 +532,8 @@ def _check_r2_threshold(
 def _fit_1p_model(x: np.ndarray, y: np.ndarray, max_cv_rmse: float) -> ChangePointModelResult:
     """Fit a 1P (constant) model as fallback."""
     baseload = np.mean(y)
-    predicted = np.full_like(y, baseload)
+    # Read-only broadcast view; the metrics below only read it
+    predicted = np.broadcast_to(np.asarray(baseload, dtype=y.dtype), y.shape)
 
     r2 = calculate_r_squared(y, predicted)
     cvrmse = calculate_cvrmse(y, predicted)
@@ -483,20 +626,117 @@ def piecewise_linear_5p(
         cooling_changepoint = heating_changepoint
         cooling_slope = 0
 
-    # Define conditions and functions for piecewise model
-    conditions = [
+    # Baseload everywhere, then the heating and cooling regimes; the cooling branch
+    # is applied last so it wins wherever the two overlap
+    y = np.where(
         x < heating_changepoint,
-        (x >= heating_changepoint) & (x <= cooling_changepoint),
+        heating_slope * x + baseload - heating_slope * heating_changepoint,
+        baseload,
+    )
+    return np.where(
         x > cooling_changepoint,
-    ]
+        cooling_slope * x + baseload - cooling_slope * cooling_changepoint,
+        y,
+    )
+
+
+if NUMBA_AVAILABLE:  # pragma: no cover - requires numba
+
+    @njit(cache=True)
+    def _piecewise_linear_5p_fit(
+        x, heating_slope, heating_changepoint, baseload, cooling_changepoint, cooling_slope
+    ):
+        """Compiled 5P model for the fitter, where all five parameters are always set."""
+        out = np.empty(x.shape[0])
+        for i in range(x.shape[0]):
+            xi = x[i]
+            if xi > cooling_changepoint:
+                out[i] = cooling_slope * xi + baseload - cooling_slope * cooling_changepoint
+            elif xi < heating_changepoint:
+                out[i] = heating_slope * xi + baseload - heating_slope * heating_changepoint
+            else:
+                out[i] = baseload
+        return out
+
+else:
+    _piecewise_linear_5p_fit = piecewise_linear_5p
+
+
+def _make_5p_fit_function(size: int):
+    """Return the 5P model function the fitter evaluates on ``size`` points.
+
+    With numba this is the compiled kernel. Otherwise it is a NumPy version of
+    ``piecewise_linear_5p`` that writes into buffers allocated once per fit; this is
+    safe because ``curve_fit`` subtracts ``ydata`` from the returned array at once.
+    """
+    if NUMBA_AVAILABLE:  # pragma: no cover - requires numba
+        return _piecewise_linear_5p_fit
+
+    out = np.empty(size)
+    cooling = np.empty(size)
+    mask = np.empty(size, dtype=bool)
+
+    def model(x, heating_slope, heating_changepoint, baseload, cooling_changepoint, cooling_slope):
+        # Same arithmetic and branch order as piecewise_linear_5p
+        np.multiply(x, heating_slope, out=out)
+        np.add(out, baseload, out=out)
+        np.subtract(out, heating_slope * heating_changepoint, out=out)
+        np.greater_equal(x, heating_changepoint, out=mask)
+        np.copyto(out, baseload, where=mask)
+        np.multiply(x, cooling_slope, out=cooling)
+        np.add(cooling, baseload, out=cooling)
+        np.subtract(cooling, cooling_slope * cooling_changepoint, out=cooling)
+        np.greater(x, cooling_changepoint, out=mask)
+        np.copyto(out, cooling, where=mask)
+        return out
+
+    return model
+
+
+def warm_up() -> None:
+    """Compile (or load from numba's on-disk cache) the 5P fitting kernel.
+
+    A no-op in effect without numba, where the kernel is plain NumPy.
+    """
+    _make_5p_fit_function(2)(np.zeros(2), 0.0, 0.0, 0.0, 0.0, 0.0)
 
-    functions = [
-        lambda x: heating_slope * x + baseload - heating_slope * heating_changepoint,
-        lambda x: baseload,
-        lambda x: cooling_slope * x + baseload - cooling_slope * cooling_changepoint,
-    ]
 
-    return np.piecewise(x, conditions, functions)
+def piecewise_linear_5p_jac(
+    x: np.ndarray,
+    heating_slope: float,
+    heating_changepoint: float,
+    baseload: float,
+    cooling_changepoint: float,
+    cooling_slope: float,
+) -> np.ndarray:
+    """Jacobian of ``piecewise_linear_5p`` with respect to its five parameters.
+
+    Used by the fitter in place of finite differences. Columns follow the parameter
+    order (heating slope, heating changepoint, baseload, cooling changepoint,
+    cooling slope); where the regimes overlap the cooling branch wins, as in
+    ``piecewise_linear_5p``.
+
+    Args:
+        x: Temperature values
+        heating_slope: Slope for heating regime
+        heating_changepoint: Temperature where heating turns on
+        baseload: Constant energy use in neutral zone
+        cooling_changepoint: Temperature where cooling turns on
+        cooling_slope: Slope for cooling regime
+
+    Returns:
+        Array of shape (len(x), 5)
+    """
+    x = np.asarray(x, dtype=float)
+    jac = np.zeros((x.size, 5))
+    heating = (x < heating_changepoint) & ~(x > cooling_changepoint)
+    cooling = x > cooling_changepoint
+    jac[heating, 0] = x[heating] - heating_changepoint
+    jac[heating, 1] = -heating_slope
+    jac[:, 2] = 1.0
+    jac[cooling, 3] = -cooling_slope
+    jac[cooling, 4] = x[cooling] - cooling_changepoint
+    return jac
 
 
 def calculate_r_squared(y_actual: np.ndarray, y_predicted: np.ndarray | float) -> float:
@@ -525,7 +765,11 @@ def calculate_r_squared(y_actual: np.ndarray, y_predicted: np.ndarray | float) -
     residuals = y_actual - y_predicted
     ss_residuals = np.sum(residuals**2)
     ss_total = np.sum((y_actual - np.mean(y_actual)) ** 2)
+    return _r_squared_from_ss(ss_residuals, ss_total)
 
+
+def _r_squared_from_ss(ss_residuals: float, ss_total: float) -> float:
+    """R-squared from precomputed residual and total sums of squares."""
     # For constant data (no variance), R² is undefined but we return 0
     # This occurs when fitting 1P model to constant data
     if ss_total == 0:
@@ -552,6 +796,12 @@ def calculate_cvrmse(y_actual: np.ndarray, y_predicted: np.ndarray) -> float:
     return rmse / mean_actual if mean_actual != 0 else np.inf
 
 
+def _cvrmse_from_ss(ss_residuals: float, mean_actual: float, n: int) -> float:
+    """CV-RMSE from a precomputed residual sum of squares."""
+    rmse = np.sqrt(ss_residuals / n)
+    return rmse / mean_actual if mean_actual != 0 else np.inf
+
+
 def plot_changepoint_model(
     x: np.ndarray,
     y: np.ndarray,
@@ -782,8 +1032,7 @@ class ChangePointModelResult(BaseModel):
 
     def get_model_complexity(self) -> int:
         """Get number of parameters in the model."""
-        model_params = {"1P": 1, "3P Heating": 3, "3P Cooling": 3, "5P": 5}
-        return model_params.get(self.model_type, 1)
+        return _MODEL_PARAMETER_COUNTS.get(self.model_type, 1)
 
     def estimate_annual_consumption(self, annual_hdd: float, annual_cdd: float) -> float:
         """Estimate annual energy consumption using heating/cooling degree days."""
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import csv
 import json
 import re
 from functools import lru_cache
@@ -62,6 +63,8 @@ US_STATE_ABBREVIATIONS = {
     "WY": "WYOMING",
 }
 
+_STATE_NAME_TO_ABBR = {name: abbr for abbr, name in US_STATE_ABBREVIATIONS.items()}
+
 ENERGY_TYPE_TO_PRICE_COLUMN = {
     "ELECTRICITY": "Electricity",
     "FOSSIL_FUEL": "Natural Gas",
@@ -71,9 +74,13 @@ FOSSIL_DEFAULT_FUEL = {
     "FOSSIL_FUEL": "NATURAL_GAS",
 }
 
+_STATE_CODE_RE = re.compile(r"\b([A-Z]{2})\b")
+_NON_DIGIT_RE = re.compile(r"[^0-9]")
+
 
 @lru_cache
-def _load_fuel_price_table() -> pd.DataFrame:
+def _load_fuel_price_table() -> dict[str, dict[str, object]]:
+    """Return ``{STATE: {column: value}}`` with missing values dropped."""
     with (
         resources.files("better_lbnl_os.data.defaults")
         .joinpath("US_fuel_price_2024.csv")
@@ -81,19 +88,25 @@ def _load_fuel_price_table() -> pd.DataFrame:
     ):
         df = pd.read_csv(fp)
     df["States"] = df["States"].str.upper()
-    return df.set_index("States")
+    return {
+        state: {column: value for column, value in row.items() if pd.notnull(value)}
+        for state, row in df.set_index("States").to_dict("index").items()
+    }
 
 
 @lru_cache
 def _load_zip_region_map() -> dict[str, str]:
+    # Plain csv is about twice as fast as pandas for this two-column, ~41k-row lookup
     with (
         resources.files("better_lbnl_os.data.defaults")
         .joinpath("zip_region_map.csv")
-        .open("rb") as fp
+        .open("r", encoding="utf-8", newline="") as fp
     ):
-        df = pd.read_csv(fp, dtype={"str_ZIP": str})
-    df["zipcode"] = df["str_ZIP"].str.zfill(5)
-    return dict(zip(df["zipcode"], df["eGRID_Subregion_1"], strict=False))
+        reader = csv.reader(fp)
+        header = next(reader)
+        zip_col = header.index("str_ZIP")
+        region_col = header.index("eGRID_Subregion_1")
+        return {row[zip_col].zfill(5): row[region_col] for row in reader}
 
 
 @lru_cache
@@ -132,11 +145,7 @@ def normalize_state_code(value: str | None) -> str | None:
         return None
     if len(value) == 2 and value.isalpha():
         return value.upper()
-    upper = value.upper()
-    for abbr, name in US_STATE_ABBREVIATIONS.items():
-        if upper == name:
-            return abbr
-    return None
+    return _STATE_NAME_TO_ABBR.get(value.upper())
 
 
 def infer_state_from_address(address: str | None) -> str | None:
@@ -155,7 +164,7 @@ def infer_state_from_address(address: str | None) -> str | None:
         candidate = parts[-1]
         if len(candidate) == 2 and candidate.isalpha():
             return candidate.upper()
-    match = re.search(r"\b([A-Z]{2})\b", address.upper())
+    match = _STATE_CODE_RE.search(address.upper())
     if match:
         return match.group(1)
     return None
@@ -178,15 +187,14 @@ def get_default_fuel_price(
     if column is None:
         return None
     table = _load_fuel_price_table()
-    if state and state in table.index:
-        value = table.at[state, column]
-        if pd.notnull(value):
+    if state:
+        value = table.get(state, {}).get(column)
+        if value is not None:
             return float(value)
     if country_code and country_code.upper() != "US":
-        if "INT" in table.index:
-            value = table.at["INT", column]
-            if pd.notnull(value):
-                return float(value)
+        value = table.get("INT", {}).get(column)
+        if value is not None:
+            return float(value)
     return None
 
 
@@ -201,7 +209,7 @@ def lookup_egrid_subregion(zipcode: str | None) -> str | None:
     """
     if not zipcode:
         return None
-    zip_clean = re.sub(r"[^0-9]", "", str(zipcode))
+    zip_clean = _NON_DIGIT_RE.sub("", str(zipcode))
     if len(zip_clean) >= 5:
         zip_clean = zip_clean[:5]
         return _load_zip_region_map().get(zip_clean)
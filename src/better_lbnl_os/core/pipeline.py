@@ -3,17 +3,21 @@
 from __future__ import annotations
 
 import logging
+import threading
+from datetime import date
 from typing import TypedDict
 
 import numpy as np
 
 from better_lbnl_os.constants import DEFAULT_CVRMSE_THRESHOLD, DEFAULT_R2_THRESHOLD
+from better_lbnl_os.core import changepoint
 from better_lbnl_os.core.changepoint import fit_changepoint_model
 from better_lbnl_os.core.geocoding.providers import GoogleMapsGeocodingProvider
 from better_lbnl_os.core.preprocessing import (
+    calendarize_monthly_eui,
     calendarize_utility_bills,
     get_consecutive_months,
-    trim_series,
+    nonzero_bounds,
 )
 from better_lbnl_os.core.weather.providers import OpenMeteoProvider
 from better_lbnl_os.core.weather.service import WeatherService
@@ -24,6 +28,7 @@ from better_lbnl_os.models import (
     UtilityBillData,
     WeatherData,
 )
+from better_lbnl_os.utils.geography import find_closest_weather_station
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +36,8 @@ logger = logging.getLogger(__name__)
 class ModelData(TypedDict):
     """Type definition for model-ready data."""
 
-    temperature: list[float]
-    eui: list[float]
+    temperature: np.ndarray
+    eui: np.ndarray
     months: list[str]
     days: list[int]
 
@@ -51,6 +56,7 @@ def prepare_model_data(
 
     Returns:
         Dict keyed by energy type with ModelData (temperature, eui, months, days).
+        Temperature and EUI are float64 arrays ready for change-point fitting.
         Only includes energy types with sufficient consecutive data after trimming.
 
     Note:
@@ -61,29 +67,20 @@ def prepare_model_data(
         block = get_consecutive_months(calendarized, energy_type=et, window=window)
         if not block:
             continue
-        eui_trim, degc_trim = trim_series(block["eui"], block["degC"])
-        if len(eui_trim) < window or len(degc_trim) < window:
-            logger.debug(
-                f"Skipping {et}: insufficient data after trimming ({len(eui_trim)} months)"
-            )
+        eui = np.asarray(block["eui"], dtype=float)
+        temperature = np.asarray(block["degC"], dtype=float)
+
+        # Trim leading/trailing zero EUI months, keeping all series aligned
+        i0, i1 = nonzero_bounds(eui)
+        if i1 - i0 < window:
+            logger.debug(f"Skipping {et}: insufficient data after trimming ({i1 - i0} months)")
             continue
-        # Align months/days with trimmed indices
-        # Find start index in original block
-        # We can align by slicing from the first non-zero to last non-zero
-        i0 = 0
-        i1 = len(block["eui"])  # exclusive
-        while i0 < i1 and float(block["eui"][i0]) == 0:
-            i0 += 1
-        while i1 > i0 and float(block["eui"][i1 - 1]) == 0:
-            i1 -= 1
-        months = block["months"][i0:i1]
-        days = block["days"][i0:i1]
 
         out[et] = {
-            "temperature": degc_trim,
-            "eui": eui_trim,
-            "months": months,
-            "days": days,
+            "temperature": temperature[i0:i1],
+            "eui": eui[i0:i1],
+            "months": block["months"][i0:i1],
+            "days": block["days"][i0:i1],
         }
     return out
 
@@ -95,19 +92,65 @@ def resolve_location(
     longitude: float | None = None,
     google_maps_api_key: str | None = None,
 ) -> LocationInfo:
-    """Resolve location metadata using Google Maps geocoding."""
+    """Resolve location metadata using Google Maps geocoding.
+
+    Results are cached per API key and (case-insensitive) address or coordinates,
+    so batch workflows over one site geocode it once.
+    """
     if google_maps_api_key is None or not str(google_maps_api_key).strip():
         raise ValueError("google_maps_api_key is required to resolve a location")
 
-    provider = GoogleMapsGeocodingProvider(api_key=google_maps_api_key)
-
     if latitude is not None and longitude is not None:
-        return provider.reverse_geocode(float(latitude), float(longitude))
-
-    if not address:
-        raise ValueError("Either coordinates or address must be provided for geocoding")
-
-    return provider.geocode(address)
+        location = _geocode_cached(google_maps_api_key, None, float(latitude), float(longitude))
+    else:
+        if not address:
+            raise ValueError("Either coordinates or address must be provided for geocoding")
+        if not isinstance(address, (str, int)):
+            raise ValueError("Invalid address; must be non-empty string or int")
+        location = _geocode_cached(google_maps_api_key, str(address).strip(), None, None)
+    # Copy so callers cannot mutate the cached result
+    return location.model_copy()
+
+
+# Geocoding results keyed by (api key, lower-cased address, lat, lon); oldest evicted first
+_GEOCODE_CACHE: dict[tuple, LocationInfo] = {}
+_GEOCODE_CACHE_MAXSIZE = 1024
+# Guards the cache for threaded batch runs; not held during the provider call
+_GEOCODE_CACHE_LOCK = threading.Lock()
+
+
+def _geocode_cached(
+    api_key: str, address: str | None, latitude: float | None, longitude: float | None
+) -> LocationInfo:
+    # Only the cache key is case-folded; the provider receives the address as given
+    key = (api_key, address.lower() if address is not None else None, latitude, longitude)
+    with _GEOCODE_CACHE_LOCK:
+        location = _GEOCODE_CACHE.get(key)
+    if location is None:
+        provider = GoogleMapsGeocodingProvider(api_key=api_key)
+        if address is None:
+            location = provider.reverse_geocode(latitude, longitude)
+        else:
+            location = provider.geocode(address)
+        with _GEOCODE_CACHE_LOCK:
+            if key not in _GEOCODE_CACHE and len(_GEOCODE_CACHE) >= _GEOCODE_CACHE_MAXSIZE:
+                del _GEOCODE_CACHE[next(iter(_GEOCODE_CACHE))]
+            _GEOCODE_CACHE[key] = location
+    return location
+
+
+def warm_up_kernels() -> None:
+    """Compile (or load from numba's on-disk cache) the optional JIT kernels.
+
+    Call once at process or worker start-up so the first fit or station lookup does
+    not pay JIT latency. Without numba the kernels are plain NumPy and this is cheap.
+    Run it on the main thread after imports complete: numba's parallel thread pool
+    first started from a helper thread (or from module import) can stall
+    interpreter shutdown.
+    """
+    changepoint.warm_up()
+    station = {"latitude": 0.0, "longitude": 0.0, "station_ID": "", "station_name": ""}
+    find_closest_weather_station(0.0, 0.0, [station])
 
 
 def fit_calendarized_models(
@@ -130,11 +173,11 @@ def fit_calendarized_models(
     model_inputs = prepare_model_data(calendarized, energy_types=energy_types)
     results: dict[str, ChangePointModelResult] = {}
     for et, data in model_inputs.items():
-        x = np.array(data["temperature"], dtype=float)
-        y = np.array(data["eui"], dtype=float)
+        x = data["temperature"]
+        y = data["eui"]
 
         # Check if we have temperature variation
-        if len(np.unique(x)) < 2:
+        if x.size < 2 or not np.any(x != x[0]):
             logger.warning(
                 f"Skipping {et}: insufficient temperature variation (likely missing weather data)"
             )
@@ -158,6 +201,7 @@ def fit_models_from_inputs(
     weather: list[WeatherData] | None,
     min_r_squared: float = DEFAULT_R2_THRESHOLD,
     max_cv_rmse: float = DEFAULT_CVRMSE_THRESHOLD,
+    use_typed: bool = True,
 ) -> dict[str, ChangePointModelResult]:
     """Fit change-point models directly from raw utility bills and weather data.
 
@@ -167,7 +211,9 @@ def fit_models_from_inputs(
         weather: Optional list of weather data
         min_r_squared: Minimum R² threshold for model acceptance
         max_cv_rmse: Maximum CV-RMSE threshold for model acceptance
-        use_typed: If True, use typed CalendarizedData (recommended)
+        use_typed: If True, use typed CalendarizedData (recommended). If False,
+            calendarize with the lean NumPy path (``calendarize_monthly_eui``),
+            which only computes the EUI and temperatures the models need
 
     Returns:
         Dictionary mapping energy type to fitted model results
@@ -178,7 +224,8 @@ def fit_models_from_inputs(
     if floor_area <= 0:
         raise ValueError(f"floor_area must be positive, got {floor_area}")
 
-    calendarized = calendarize_utility_bills(bills=bills, floor_area=floor_area, weather=weather)
+    calendarize = calendarize_utility_bills if use_typed else calendarize_monthly_eui
+    calendarized = calendarize(bills=bills, floor_area=floor_area, weather=weather)
     return fit_calendarized_models(
         calendarized, min_r_squared=min_r_squared, max_cv_rmse=max_cv_rmse
     )
@@ -203,7 +250,10 @@ def get_weather_for_bills(
         openmeteo_api_key: Optional OpenMeteo API key (paid archive)
 
     Returns:
-        List of WeatherData, one per month.
+        List of WeatherData, one per month. Fetches are cached per location, month
+        range and API key, but only when every month came back and the range ends
+        before the current month; partial (failed) and still-changing ranges are
+        fetched again on the next call.
 
     Raises:
         ValueError: If neither coordinates nor address provided, or if geocoding API key missing
@@ -228,9 +278,47 @@ def get_weather_for_bills(
     start_year, start_month = min_start.year, min_start.month
     end_year, end_month = max_end.year, max_end.month
 
+    key = (loc.model_dump_json(), start_year, start_month, end_year, end_month, openmeteo_api_key)
+    with _WEATHER_CACHE_LOCK:
+        cached = _WEATHER_CACHE.get(key)
+    if cached is None:
+        weather = _fetch_weather_range(
+            loc, start_year, start_month, end_year, end_month, openmeteo_api_key
+        )
+        # Only complete ranges of finished months are cached: the month-by-month
+        # fallback drops months that fail, and the current month is still changing
+        n_months = (end_year - start_year) * 12 + end_month - start_month + 1
+        complete = len({(w.year, w.month) for w in weather}) >= n_months
+        today = date.today()
+        finished = (end_year, end_month) < (today.year, today.month)
+        if not (complete and finished):
+            return weather
+        cached = tuple(weather)
+        with _WEATHER_CACHE_LOCK:
+            if key not in _WEATHER_CACHE and len(_WEATHER_CACHE) >= _WEATHER_CACHE_MAXSIZE:
+                del _WEATHER_CACHE[next(iter(_WEATHER_CACHE))]
+            _WEATHER_CACHE[key] = cached
+    # Copy so callers cannot mutate the cached result
+    return [w.model_copy() for w in cached]
+
+
+# Complete weather ranges keyed by (location JSON, month range, API key); oldest evicted first
+_WEATHER_CACHE: dict[tuple, tuple[WeatherData, ...]] = {}
+_WEATHER_CACHE_MAXSIZE = 256
+_WEATHER_CACHE_LOCK = threading.Lock()
+
+
+def _fetch_weather_range(
+    location: LocationInfo,
+    start_year: int,
+    start_month: int,
+    end_year: int,
+    end_month: int,
+    openmeteo_api_key: str | None,
+) -> list[WeatherData]:
     service = WeatherService(provider=OpenMeteoProvider(api_key=openmeteo_api_key))
     return service.get_weather_range(
-        location=loc,
+        location=location,
         start_year=start_year,
         start_month=start_month,
         end_year=end_year,
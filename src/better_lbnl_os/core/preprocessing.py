@@ -5,14 +5,18 @@ Calendarizes utility bills to monthly aggregates aligned with weather data.
 
 from __future__ import annotations
 
-import calendar as _calendar
+from collections.abc import Mapping
 from dataclasses import dataclass, field
-from datetime import timedelta
 
+import numpy as np
 import pandas as pd
 
 from better_lbnl_os.constants import CONVERSION_TO_KWH, MINIMUM_UTILITY_MONTHS
-from better_lbnl_os.constants.energy import normalize_fuel_type, normalize_fuel_unit
+from better_lbnl_os.constants.energy import (
+    convert_to_kwh,
+    normalize_fuel_type,
+    normalize_fuel_unit,
+)
 from better_lbnl_os.models import UtilityBillData, WeatherData
 
 # Import CalendarizedData and related from submodules to avoid circular imports
@@ -29,7 +33,8 @@ class CalendarizationOptions:
     """Options for calendarization processing."""
 
     energy_type_map: dict[str, str] | None = None
-    conversion_to_kwh: dict[tuple[str, str], float] = field(
+    # Defaults to the shared read-only table so convert_to_kwh can use its prebuilt LUT
+    conversion_to_kwh: Mapping[tuple[str, str], float] = field(
         default_factory=lambda: CONVERSION_TO_KWH
     )
     emission_factor_by_fuel: dict[str, float] | None = None  # kg CO2 per kWh
@@ -77,50 +82,41 @@ def calendarize_utility_bills(
         )
 
     # ------------------ Prepare daily utility bill data ------------------
-    rows = []
-    for b in bills:
-        rows.append(
-            {
-                "bill_start_date": b.start_date,
-                "bill_end_date": b.end_date,
-                "consumption": float(b.consumption),
-                "Fuel_Type": b.fuel_type,
-                "unit": b.units,
-                "cost": float(b.cost) if b.cost is not None else None,
-            }
-        )
-    df_bills = pd.DataFrame(rows)
+    # Built column-wise; missing costs become NaN
+    n = len(bills)
+    df_bills = pd.DataFrame(
+        {
+            "bill_start_date": [b.start_date for b in bills],
+            "bill_end_date": [b.end_date for b in bills],
+            "consumption": np.fromiter((b.consumption for b in bills), dtype=float, count=n),
+            "Fuel_Type": [b.fuel_type for b in bills],
+            "unit": [b.units for b in bills],
+            "cost": np.fromiter(
+                (np.nan if b.cost is None else b.cost for b in bills), dtype=float, count=n
+            ),
+        }
+    )
 
-    # Energy type mapping with heuristic fallback
+    # Energy type mapping with heuristic fallback (inferred once per distinct fuel)
+    inferred = {fuel: _infer_energy_type(fuel) for fuel in df_bills["Fuel_Type"].unique()}
+    energy_types = df_bills["Fuel_Type"].map(inferred)
     if opts.energy_type_map:
-        df_bills["Energy_Type"] = (
-            df_bills["Fuel_Type"]
-            .map(opts.energy_type_map)
-            .fillna(df_bills["Fuel_Type"].map(_infer_energy_type))
-        )
-    else:
-        df_bills["Energy_Type"] = df_bills["Fuel_Type"].map(_infer_energy_type)
-    df_bills["Fuel_Type"] = df_bills["Fuel_Type"].apply(normalize_fuel_type)
-    df_bills["unit"] = df_bills["unit"].apply(normalize_fuel_unit)
-
-    # Convert to kWh
-    def _to_kwh(row) -> float:
-        fuel_token = normalize_fuel_type(row.get("Fuel_Type"))
-        unit_token = normalize_fuel_unit(row.get("unit"))
-        factor = opts.conversion_to_kwh.get((fuel_token, unit_token))
-        if factor is None:
-            return row["consumption"]
-        return row["consumption"] * factor
+        energy_types = df_bills["Fuel_Type"].map(opts.energy_type_map).fillna(energy_types)
+    df_bills["Energy_Type"] = energy_types
+    # Canonical labels, normalized once per distinct value
+    for column, normalize in (("Fuel_Type", normalize_fuel_type), ("unit", normalize_fuel_unit)):
+        codes, labels = pd.factorize(df_bills[column], use_na_sentinel=False)
+        df_bills[column] = np.array([normalize(v) for v in labels], dtype=object)[codes]
 
-    df_bills["standard_consumption"] = df_bills.apply(_to_kwh, axis=1)
+    # Convert to kWh; pairs without a factor keep their raw consumption
+    kwh = convert_to_kwh(df_bills, "Fuel_Type", "unit", "consumption", opts.conversion_to_kwh)
+    df_bills["standard_consumption"] = np.where(np.isnan(kwh), df_bills["consumption"], kwh)
 
     # Emissions if factors provided
     if opts.emission_factor_by_fuel:
-        df_bills["standard_emission"] = df_bills.apply(
-            lambda x: x["standard_consumption"]
-            * float(opts.emission_factor_by_fuel.get(x["Fuel_Type"], 0.0)),
-            axis=1,
-        )
+        # Fuels without a factor get zero emissions
+        factors = df_bills["Fuel_Type"].map(opts.emission_factor_by_fuel).fillna(0.0)
+        df_bills["standard_emission"] = df_bills["standard_consumption"] * factors.astype(float)
     # Costs / unit price if cost provided
     if df_bills["cost"].notna().any():
         df_bills["standard_cost"] = df_bills["cost"].fillna(0.0)
@@ -131,25 +127,9 @@ def calendarize_utility_bills(
     df_bills["bill_end_date"] = pd.to_datetime(df_bills["bill_end_date"])
     df_bills["days"] = (df_bills["bill_end_date"] - df_bills["bill_start_date"]).dt.days + 1
 
-    daily_chunks: list[pd.DataFrame] = []
-    for _, row in df_bills.iterrows():
-        # guard invalid ranges
-        if row["days"] <= 0:
-            continue
-        dates = [row["bill_start_date"] + timedelta(days=d) for d in range(int(row["days"]))]
-        data = {
-            "date": dates,
-            "standard_consumption": row["standard_consumption"] / row["days"],
-            "Fuel_Type": row["Fuel_Type"],
-            "Energy_Type": row["Energy_Type"],
-        }
-        if "standard_emission" in df_bills.columns:
-            data["standard_emission"] = row["standard_emission"] / row["days"]
-        if "standard_cost" in df_bills.columns:
-            data["standard_cost"] = row["standard_cost"] / row["days"]
-        daily_chunks.append(pd.DataFrame(data))
-
-    if not daily_chunks:
+    # One row per day of each valid bill, built with np.repeat instead of per-bill frames
+    df_bills = df_bills[df_bills["days"] > 0]
+    if df_bills.empty:
         # No valid days - return empty CalendarizedData
         return CalendarizedData(
             weather=WeatherSeries(degC=[], degF=[]),
@@ -157,146 +137,99 @@ def calendarize_utility_bills(
             aggregated=EnergyAggregation(),
         )
 
-    df_daily = pd.concat(daily_chunks, ignore_index=True)
-    df_daily["Year-Month"] = df_daily["date"].dt.strftime("%Y-%m")
+    days = df_bills["days"].to_numpy(dtype=np.int64)
+    starts = df_bills["bill_start_date"].to_numpy(dtype="datetime64[D]")
+    day_offsets = np.arange(days.sum()) - np.repeat(np.cumsum(days) - days, days)
+    data = {
+        "date": np.repeat(starts, days) + day_offsets.astype("timedelta64[D]"),
+        "standard_consumption": np.repeat(df_bills["standard_consumption"].to_numpy() / days, days),
+    }
+    # Type columns as categoricals (sorted categories keep the output column order),
+    # so the daily frame repeats and groups small integer codes instead of strings
+    for column in ("Fuel_Type", "Energy_Type"):
+        codes, categories = pd.factorize(df_bills[column], sort=True)
+        data[column] = pd.Categorical.from_codes(np.repeat(codes, days), categories=categories)
+    for column in ("standard_emission", "standard_cost"):
+        if column in df_bills.columns:
+            data[column] = np.repeat(df_bills[column].to_numpy() / days, days)
+    df_daily = pd.DataFrame(data)
+    # Month key as datetime64[M]; labels are only formatted once per output month
+    df_daily["Year-Month"] = data["date"].astype("datetime64[M]")
 
     # ------------------ Monthly aggregates ------------------
-    def _monthly_normalized(df: pd.DataFrame, floor: float, var: str) -> pd.DataFrame:
-        # daily_standard_eui = kWh / floor_area / unique_days_in_month_group
-        grp = df.groupby(["Year-Month", var])
-        daily_eui = (
-            (grp["standard_consumption"].sum() / float(floor) / grp["date"].nunique())
-            if floor > 0
-            else None
-        )
-
-        blocks = []
-        if daily_eui is not None:
-            blocks.append(
-                pd.DataFrame(daily_eui).reset_index().rename(columns={0: "daily_standard_eui"})
-            )
-        if "standard_emission" in df.columns:
-            unit_emission = grp["standard_emission"].sum() / grp["standard_consumption"].sum()
-            blocks.append(
-                pd.DataFrame(unit_emission).reset_index().rename(columns={0: "unit_emission"})
-            )
-        if "standard_cost" in df.columns:
-            unit_price = grp["standard_cost"].sum() / grp["standard_consumption"].sum()
-            blocks.append(pd.DataFrame(unit_price).reset_index().rename(columns={0: "unit_price"}))
-
-        if not blocks:
-            return pd.DataFrame(index=pd.Index([], name="Year-Month"))
-
-        df_monthly = pd.concat(blocks)
-        # Only pivot columns that actually exist
-        pivot_values = []
-        if "daily_standard_eui" in df_monthly.columns:
-            pivot_values.append("daily_standard_eui")
-        if "unit_emission" in df_monthly.columns:
-            pivot_values.append("unit_emission")
-        if "unit_price" in df_monthly.columns:
-            pivot_values.append("unit_price")
-
-        if not pivot_values:
-            return pd.DataFrame(index=pd.Index([], name="Year-Month"))
-
-        df_monthly = df_monthly.pivot_table(index="Year-Month", columns=var, values=pivot_values)
-        df_monthly.columns = [
-            f"{var} - {' - '.join(col[::-1]).strip()}" for col in df_monthly.columns.values
+    def _monthly_by(df: pd.DataFrame, floor: float, var: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+        """Return (totals, normalized) monthly frames by ``var`` from one groupby pass."""
+        grp = df.groupby(["Year-Month", var], observed=True)
+        sum_columns = [
+            c
+            for c in ("standard_consumption", "standard_emission", "standard_cost")
+            if c in df.columns
         ]
-        return df_monthly
+        sums = grp[sum_columns].sum()
+
+        totals = sums.unstack(var).fillna(0)
+        totals.columns = [f"{var} - {col[1]} - {col[0]}" for col in totals.columns.values]
+
+        # daily_standard_eui = kWh / floor_area / unique_days_in_month_group. Bill end
+        # dates are inclusive, so back-to-back bills (and fuels sharing an energy type)
+        # put several rows on one date; grp.size() would overcount those days.
+        metrics = {}
+        if floor > 0:
+            metrics["daily_standard_eui"] = (
+                sums["standard_consumption"] / float(floor) / grp["date"].nunique()
+            )
+        if "standard_emission" in sums.columns:
+            metrics["unit_emission"] = sums["standard_emission"] / sums["standard_consumption"]
+        if "standard_cost" in sums.columns:
+            metrics["unit_price"] = sums["standard_cost"] / sums["standard_consumption"]
+        if not metrics:
+            return totals, pd.DataFrame(index=pd.DatetimeIndex([], name="Year-Month"))
+
+        # Drop groups and columns with no defined metric (e.g. 0/0 unit ratios)
+        normalized = (
+            pd.DataFrame(metrics)
+            .dropna(how="all")
+            .unstack(var)
+            .sort_index(axis=1)
+            .dropna(axis=1, how="all")
+        )
+        normalized.columns = [f"{var} - {col[1]} - {col[0]}" for col in normalized.columns.values]
+        return totals, normalized
 
-    df_norm_by_fuel = _monthly_normalized(df_daily, floor_area, var="Fuel_Type")
-    df_norm_by_energy = _monthly_normalized(df_daily, floor_area, var="Energy_Type")
+    df_agg_fuel, df_norm_by_fuel = _monthly_by(df_daily, floor_area, var="Fuel_Type")
+    df_agg_energy, df_norm_by_energy = _monthly_by(df_daily, floor_area, var="Energy_Type")
     df_norm = pd.concat([df_norm_by_fuel, df_norm_by_energy], axis=1)
 
-    # Aggregated totals by energy/fuel type
-    grouped_energy = df_daily.groupby(["Year-Month", "Energy_Type"])  # sums
-    df_agg_energy = grouped_energy[["standard_consumption"]].sum().unstack().fillna(0)
-    df_agg_energy.columns = [
-        f"Energy_Type - {col[1]} - standard_consumption" for col in df_agg_energy.columns.values
-    ]
-
-    grouped_fuel = df_daily.groupby(["Year-Month", "Fuel_Type"])  # sums
-    df_agg_fuel = grouped_fuel[["standard_consumption"]].sum().unstack().fillna(0)
-    df_agg_fuel.columns = [
-        f"Fuel_Type - {col[1]} - standard_consumption" for col in df_agg_fuel.columns.values
-    ]
-
-    # Add optional totals for emissions and costs
-    if "standard_emission" in df_daily.columns:
-        df_e_ghg = grouped_energy[["standard_emission"]].sum().unstack().fillna(0)
-        df_e_ghg.columns = [
-            f"Energy_Type - {c[1]} - standard_emission" for c in df_e_ghg.columns.values
-        ]
-        df_agg_energy = pd.concat([df_agg_energy, df_e_ghg], axis=1)
-
-        df_f_ghg = grouped_fuel[["standard_emission"]].sum().unstack().fillna(0)
-        df_f_ghg.columns = [
-            f"Fuel_Type - {c[1]} - standard_emission" for c in df_f_ghg.columns.values
-        ]
-        df_agg_fuel = pd.concat([df_agg_fuel, df_f_ghg], axis=1)
-
-    if "standard_cost" in df_daily.columns:
-        df_e_cost = grouped_energy[["standard_cost"]].sum().unstack().fillna(0)
-        df_e_cost.columns = [
-            f"Energy_Type - {c[1]} - standard_cost" for c in df_e_cost.columns.values
-        ]
-        df_agg_energy = pd.concat([df_agg_energy, df_e_cost], axis=1)
-
-        df_f_cost = grouped_fuel[["standard_cost"]].sum().unstack().fillna(0)
-        df_f_cost.columns = [
-            f"Fuel_Type - {c[1]} - standard_cost" for c in df_f_cost.columns.values
-        ]
-        df_agg_fuel = pd.concat([df_agg_fuel, df_f_cost], axis=1)
-
     # Merge normalized and aggregated frames
     df_monthly = pd.concat([df_agg_energy, df_agg_fuel, df_norm], axis=1)
     df_monthly = df_monthly.reset_index()
 
     # Add days in each month
-    df_monthly["days_in_month"] = df_monthly["Year-Month"].apply(
-        lambda ym: _calendar.monthrange(int(ym.split("-")[0]), int(ym.split("-")[1]))[1]
-    )
+    months = pd.PeriodIndex(df_monthly["Year-Month"], freq="M")
+    df_monthly["days_in_month"] = months.days_in_month.to_numpy()
 
-    # Weather merge (optional)
+    # Weather merge (optional); the first entry wins for duplicate months and months
+    # without weather are zero-filled below
     if weather:
-        # Dedup by year, month — keep first occurrence
-        seen = set()
-        uniq: list[WeatherData] = []
+        temp_by_month: dict[str, float] = {}
         for w in weather:
-            key = (w.year, w.month)
-            if key in seen:
-                continue
-            seen.add(key)
-            uniq.append(w)
-
-        df_w = pd.DataFrame(
-            [{"year": w.year, "month": w.month, "avg_value_c": w.avg_temp_c} for w in uniq]
-        )
-        if not df_w.empty:
-            df_w["avg_value_f"] = df_w["avg_value_c"].apply(lambda x: x * 1.8 + 32)
-            df_w["Year-Month"] = pd.to_datetime(df_w[["year", "month"]].assign(day=1)).dt.strftime(
-                "%Y-%m"
-            )
-            df_w = df_w.drop(columns=["year", "month"])
-            df_monthly = df_monthly.merge(df_w, on="Year-Month", how="left")
-        else:
-            df_monthly["avg_value_c"] = 0.0
-            df_monthly["avg_value_f"] = 0.0
+            temp_by_month.setdefault(f"{w.year:04d}-{w.month:02d}", w.avg_temp_c)
+        df_monthly["avg_value_c"] = months.strftime("%Y-%m").map(temp_by_month).to_numpy()
+        df_monthly["avg_value_f"] = df_monthly["avg_value_c"] * 1.8 + 32
     else:
         df_monthly["avg_value_c"] = 0.0
         df_monthly["avg_value_f"] = 0.0
 
     # To YYYY-MM-01 for x-axis consistency
-    df_monthly["Year-Month"] = df_monthly["Year-Month"].astype(str) + "-01"
+    df_monthly["Year-Month"] = months.strftime("%Y-%m-01")
 
-    # Fill strategy for unit metrics if present
+    # Fill strategy for unit metrics if present; only columns with gaps are rewritten
     if opts.fill_strategy == "mean":
         for col in df_monthly.columns:
             if "unit_emission" in col or "unit_price" in col:
-                if col in df_monthly:
-                    df_monthly[col] = df_monthly[col].fillna(df_monthly[col].mean())
+                values = df_monthly[col]
+                if values.hasnans:
+                    df_monthly[col] = values.fillna(values.mean())
     df_monthly = df_monthly.fillna(0)
 
     cols = df_monthly.columns
@@ -316,17 +249,6 @@ def calendarize_utility_bills(
             if c.startswith(prefix) and c.endswith(metric)
         }
 
-    {
-        "periods": periods,
-        "v_x": periods,  # alias for compatibility with Django naming
-        "dict_v_energy": _subset("Fuel_Type", "standard_consumption"),
-        "dict_v_costs": _subset("Fuel_Type", "standard_cost"),
-        "dict_v_ghg": _subset("Fuel_Type", "standard_emission"),
-        "dict_v_eui": _subset("Fuel_Type", "daily_standard_eui"),
-        "dict_v_unit_prices": _subset("Fuel_Type", "unit_price"),
-        "dict_v_ghg_factors": _subset("Fuel_Type", "unit_emission"),
-    }
-
     # Convert periods to date objects
     period_dates = [pd.Timestamp(p).date() for p in periods]
     days_in_period = df_monthly["days_in_month"].tolist()
@@ -363,6 +285,108 @@ def calendarize_utility_bills(
 # Note: Single canonical API above returns CalendarizedData
 
 
+def calendarize_monthly_eui(
+    bills: list[UtilityBillData],
+    floor_area: float,
+    weather: list[WeatherData] | None = None,
+    options: CalendarizationOptions | None = None,
+) -> dict:
+    """Calendarize bills to monthly daily EUI by energy type using NumPy only.
+
+    A lean counterpart of :func:`calendarize_utility_bills` for the modeling path.
+    It returns only the legacy-dict keys read by :func:`get_consecutive_months`
+    (``aggregated`` periods, days and EUI, and ``weather`` temperatures) with the
+    same values, skipping the DataFrame aggregation of costs and emissions.
+
+    Args:
+        bills: List of UtilityBillData entries.
+        floor_area: Building floor area (sq ft). If <= 0, EUI metrics are omitted.
+        weather: Optional list of WeatherData to merge by (year, month).
+        options: Optional CalendarizationOptions for mappings and factors.
+
+    Returns:
+        Legacy-format dict with ``weather`` (degC, degF) and ``aggregated``
+        (periods, days_in_period, dict_v_eui) entries.
+    """
+    opts = options or CalendarizationOptions()
+    bills = [b for b in bills if (b.end_date - b.start_date).days >= 0]
+    if not bills:
+        return {
+            "weather": {"degC": [], "degF": []},
+            "aggregated": {"periods": [], "days_in_period": [], "dict_v_eui": {}},
+        }
+
+    # Energy type and kWh factor resolved once per distinct fuel / (fuel, unit) pair
+    energy_type_map = opts.energy_type_map or {}
+    energy_type_by_fuel: dict[str, str] = {}
+    factor_by_pair: dict[tuple[str, str], float] = {}
+    for b in bills:
+        if b.fuel_type not in energy_type_by_fuel:
+            mapped = energy_type_map.get(b.fuel_type)
+            energy_type_by_fuel[b.fuel_type] = mapped or _infer_energy_type(b.fuel_type)
+        pair = (b.fuel_type, b.units)
+        if pair not in factor_by_pair:
+            canonical = (normalize_fuel_type(b.fuel_type), normalize_fuel_unit(b.units))
+            factor_by_pair[pair] = opts.conversion_to_kwh.get(canonical, 1.0)
+    energy_types = sorted(set(energy_type_by_fuel.values()))
+    et_index = {et: i for i, et in enumerate(energy_types)}
+
+    n = len(bills)
+    starts = np.array([b.start_date for b in bills], dtype="datetime64[D]").astype(np.int64)
+    days = np.array([b.end_date for b in bills], dtype="datetime64[D]").astype(np.int64)
+    days = days - starts + 1
+    kwh = np.fromiter(
+        (float(b.consumption) * factor_by_pair[(b.fuel_type, b.units)] for b in bills),
+        dtype=float,
+        count=n,
+    )
+    bill_et = np.fromiter(
+        (et_index[energy_type_by_fuel[b.fuel_type]] for b in bills), dtype=np.intp, count=n
+    )
+
+    # One entry per day of each bill, keyed by (month, energy type)
+    day_offsets = np.arange(days.sum()) - np.repeat(np.cumsum(days) - days, days)
+    day = np.repeat(starts, days) + day_offsets
+    months, month_idx = np.unique(
+        day.astype("datetime64[D]").astype("datetime64[M]"), return_inverse=True
+    )
+    n_cells = months.size * len(energy_types)
+    cell = month_idx * len(energy_types) + np.repeat(bill_et, days)
+    sums = np.bincount(cell, weights=np.repeat(kwh / days, days), minlength=n_cells)
+
+    # Overlapping bills of one energy type share calendar days; count each day once
+    span = int(day.max() - day.min()) + 1
+    distinct = np.unique(cell * span + (day - day.min()))
+    n_days = np.bincount(distinct // span, minlength=n_cells)
+
+    dict_v_eui: dict[str, list[float]] = {}
+    if floor_area > 0:
+        eui = np.divide(sums / float(floor_area), n_days, out=np.zeros(n_cells), where=n_days > 0)
+        eui = eui.reshape(months.size, len(energy_types))
+        dict_v_eui = {et: eui[:, i].tolist() for i, et in enumerate(energy_types)}
+
+    # Weather join; the first entry wins for duplicate months, missing months are zero
+    if weather:
+        temp_by_month: dict[int, float] = {}
+        for w in weather:
+            temp_by_month.setdefault((w.year - 1970) * 12 + w.month - 1, w.avg_temp_c)
+        deg_c = np.array([temp_by_month.get(m, np.nan) for m in months.astype(np.int64)], float)
+        deg_f = np.nan_to_num(deg_c * 1.8 + 32)
+        deg_c = np.nan_to_num(deg_c)
+    else:
+        deg_c = deg_f = np.zeros(months.size)
+
+    month_days = (months + 1).astype("datetime64[D]") - months.astype("datetime64[D]")
+    return {
+        "weather": {"degC": deg_c.tolist(), "degF": deg_f.tolist()},
+        "aggregated": {
+            "periods": [f"{m}-01" for m in months.astype(str)],
+            "days_in_period": month_days.astype(np.int64).tolist(),
+            "dict_v_eui": dict_v_eui,
+        },
+    }
+
+
 # ------------------ Additional helpers for model preparation ------------------
 def get_consecutive_months(
     calendarized: CalendarizedData | dict,
@@ -457,6 +481,17 @@ def get_consecutive_months(
     }
 
 
+def nonzero_bounds(eui: list[float] | np.ndarray) -> tuple[int, int]:
+    """Return ``(i0, i1)`` such that ``eui[i0:i1]`` drops leading and trailing zeros.
+
+    All-zero or empty input gives an empty slice ``(0, 0)``.
+    """
+    nonzero = np.flatnonzero(np.asarray(eui, dtype=float) != 0)
+    if nonzero.size == 0:
+        return 0, 0
+    return int(nonzero[0]), int(nonzero[-1]) + 1
+
+
 def trim_series(eui: list[float], degc: list[float]) -> tuple[list[float], list[float]]:
     """Trim leading and trailing zeros from EUI while keeping arrays aligned.
 
@@ -465,12 +500,7 @@ def trim_series(eui: list[float], degc: list[float]) -> tuple[list[float], list[
     try:
         if len(eui) != len(degc) or len(eui) == 0:
             return eui, degc
-        i0 = 0
-        i1 = len(eui)
-        while i0 < i1 and float(eui[i0]) == 0:
-            i0 += 1
-        while i1 > i0 and float(eui[i1 - 1]) == 0:
-            i1 -= 1
+        i0, i1 = nonzero_bounds(eui)
         return eui[i0:i1], degc[i0:i1]
     except Exception:
         return eui, degc
@@ -1,5 +1,9 @@
 """Core services for orchestrating building energy analytics workflows (moved)."""
 
+from collections import Counter
+
+import numpy as np
+
 from better_lbnl_os.core.changepoint import ChangePointModelResult
 from better_lbnl_os.core.recommendations import EEMeasureRecommendation
 from better_lbnl_os.core.savings import SavingsEstimate
@@ -86,13 +90,17 @@ class PortfolioBenchmarkService:
         self.buildings.append(building)
         self.results.append(benchmark_result)
 
+    def _percentile_values(self) -> np.ndarray:
+        # Read from results on every call so direct edits to the list are honored
+        return np.fromiter(
+            (r.percentile for r in self.results), dtype=float, count=len(self.results)
+        )
+
     def calculate_portfolio_metrics(self) -> dict:
         if not self.results:
             return {"status": "error", "message": "No buildings in portfolio"}
-        avg_percentile = sum(r.percentile for r in self.results) / len(self.results)
-        rating_counts: dict[str, int] = {}
-        for result in self.results:
-            rating_counts[result.rating] = rating_counts.get(result.rating, 0) + 1
+        avg_percentile = float(np.mean(self._percentile_values()))
+        rating_counts: dict[str, int] = dict(Counter(r.rating for r in self.results))
         return {
             "total_buildings": len(self.buildings),
             "average_percentile": avg_percentile,
@@ -100,8 +108,19 @@ class PortfolioBenchmarkService:
         }
 
     def identify_improvement_targets(self, top_n: int = 10) -> list[str]:
-        sorted_results = sorted(self.results, key=lambda r: r.percentile, reverse=True)
-        return [r.building_id for r in sorted_results[:top_n]]
+        if top_n <= 0:
+            return []
+        percentiles = self._percentile_values()
+        if top_n >= percentiles.size:
+            order = np.argsort(-percentiles, kind="stable")
+        else:
+            # Partial selection is O(N); ties at the cutoff are resolved by insertion order
+            cutoff = percentiles[np.argpartition(-percentiles, top_n - 1)[top_n - 1]]
+            above = np.flatnonzero(percentiles > cutoff)
+            ties = np.flatnonzero(percentiles == cutoff)[: top_n - above.size]
+            order = np.concatenate([above, ties])
+            order = order[np.argsort(-percentiles[order], kind="stable")]
+        return [self.results[i].building_id for i in order]
 
     def generate_portfolio_report(self) -> dict:
         metrics = self.calculate_portfolio_metrics()
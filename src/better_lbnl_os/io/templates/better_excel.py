@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass
 
 import pandas as pd
@@ -12,6 +13,8 @@ from better_lbnl_os.constants.template_parsing import (
     BETTER_BILLS_HEADERS,
     BETTER_META_HEADERS,
     BETTERTemplateConfig,
+    canonical_bills_header,
+    canonical_meta_header,
 )
 from better_lbnl_os.models import BuildingData, UtilityBillData
 
@@ -24,11 +27,10 @@ class _SheetNames:
     bills: str = "Utility Data"
 
 
-def _find_column(df: pd.DataFrame, candidates: list[str]) -> str | None:
-    cols = list(df.columns)
+def _find_column(columns: list, candidates: Sequence[str]) -> str | None:
     # Clean column names - strip whitespace and handle unnamed columns
     cleaned_cols = {}
-    for col in cols:
+    for col in columns:
         if isinstance(col, str):
             cleaned = col.strip()
             cleaned_cols[cleaned] = col
@@ -51,21 +53,31 @@ def _find_column(df: pd.DataFrame, candidates: list[str]) -> str | None:
 
 def _map_columns(
     df: pd.DataFrame,
-    spec: dict[str, list[str]],
+    spec: dict[str, tuple[str, ...]],
+    classify: Callable[[str], str | None],
     sheet: str,
     errors: list[ParseMessage],
     optional_keys: list[str] | None = None,
 ) -> dict[str, str]:
+    # Bucket columns by canonical key with a single lookup per header
+    matches: dict[str, list] = {}
+    for col in df.columns:
+        key = classify(col if isinstance(col, str) else str(col))
+        if key is not None:
+            matches.setdefault(key, []).append(col)
+
     mapping: dict[str, str] = {}
     optional = set(optional_keys or [])
     for key, candidates in spec.items():
-        col = _find_column(df, candidates)
+        found = matches.get(key, [])
+        # Several columns for one key: keep the candidate-order preference
+        col = found[0] if len(found) == 1 else _find_column(found, candidates)
         if col is None and key not in optional:
             errors.append(
                 ParseMessage(
                     severity="error",
                     sheet=sheet,
-                    message=f"Missing required column for {key}: one of {candidates}",
+                    message=f"Missing required column for {key}: one of {list(candidates)}",
                 )
             )
         elif col is not None:
@@ -112,10 +124,13 @@ def read_better_excel(file_like, lang: str | None = None) -> ParsedPortfolio:
         return result
 
     # Map columns (no need for retry logic with deterministic skiprows)
-    meta_map = _map_columns(df_meta, BETTER_META_HEADERS, sn.meta, result.errors)
+    meta_map = _map_columns(
+        df_meta, BETTER_META_HEADERS, canonical_meta_header, sn.meta, result.errors
+    )
     bills_map = _map_columns(
         df_bills,
         BETTER_BILLS_HEADERS,
+        canonical_bills_header,
         sn.bills,
         result.errors,
         optional_keys=["COST"],
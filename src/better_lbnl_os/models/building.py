@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import numpy as np
+
 if TYPE_CHECKING:
     from better_lbnl_os.models.utility_bills import UtilityBillData
 from pydantic import BaseModel, Field, field_validator
@@ -37,23 +39,31 @@ class BuildingData(BaseModel):
             errors.append("No utility bills provided")
             return errors
 
-        # Check for gaps in billing periods
-        sorted_bills = sorted(bills, key=lambda b: b.start_date)
-        for i in range(len(sorted_bills) - 1):
-            gap_days = (sorted_bills[i + 1].start_date - sorted_bills[i].end_date).days
-            if gap_days > 1:
-                errors.append(
-                    f"Gap of {gap_days} days between bills ending {sorted_bills[i].end_date} "
-                    f"and starting {sorted_bills[i + 1].start_date}"
-                )
+        n = len(bills)
+        start_ord = np.fromiter((b.start_date.toordinal() for b in bills), dtype=np.int64, count=n)
+        end_ord = np.fromiter((b.end_date.toordinal() for b in bills), dtype=np.int64, count=n)
+        consumption = np.fromiter((b.consumption for b in bills), dtype=float, count=n)
+
+        # Check for gaps in billing periods (stable sort keeps input order on ties)
+        order = np.argsort(start_ord, kind="stable")
+        gaps = start_ord[order][1:] - end_ord[order][:-1]
+        for i in np.flatnonzero(gaps > 1):
+            prev_bill, next_bill = bills[order[i]], bills[order[i + 1]]
+            errors.append(
+                f"Gap of {gaps[i]} days between bills ending {prev_bill.end_date} "
+                f"and starting {next_bill.start_date}"
+            )
 
         # Check for reasonable consumption values
-        for bill in bills:
-            daily_avg = bill.calculate_daily_average()
-            if daily_avg <= 0:
-                errors.append(f"Non-positive consumption for bill starting {bill.start_date}")
-            elif daily_avg > 1000 * self.floor_area:  # Sanity check
-                errors.append(f"Unusually high consumption for bill starting {bill.start_date}")
+        days = end_ord - start_ord
+        daily_avg = np.divide(consumption, days, out=np.zeros(n), where=days > 0)
+        non_positive = daily_avg <= 0
+        too_high = ~non_positive & (daily_avg > 1000 * self.floor_area)  # Sanity check
+        for i in np.flatnonzero(non_positive | too_high):
+            if non_positive[i]:
+                errors.append(f"Non-positive consumption for bill starting {bills[i].start_date}")
+            else:
+                errors.append(f"Unusually high consumption for bill starting {bills[i].start_date}")
 
         return errors
 
@@ -66,10 +76,10 @@ class BuildingData(BaseModel):
 
     def get_space_type_code(self) -> str:
         """Return the enum code (name) for the current space type (e.g., "Office" -> "OFFICE")."""
-        for st in BuildingSpaceType:
-            if self.space_type == st.value:
-                return st.name
-        return "OTHER"
+        try:
+            return BuildingSpaceType(self.space_type).name
+        except ValueError:
+            return "OTHER"
 
 
 __all__ = ["BuildingData"]
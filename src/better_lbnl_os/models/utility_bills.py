@@ -4,8 +4,7 @@ from datetime import date, datetime
 
 from pydantic import BaseModel, Field, model_validator
 
-from better_lbnl_os.constants import CONVERSION_TO_KWH
-from better_lbnl_os.constants.energy import normalize_fuel_type, normalize_fuel_unit
+from better_lbnl_os.constants.energy import get_conversion_factor
 from better_lbnl_os.models.weather import WeatherSeries
 
 
@@ -26,6 +25,34 @@ class UtilityBillData(BaseModel):
             raise ValueError("End date must be after start date")
         return self
 
+    @classmethod
+    def from_trusted(
+        cls,
+        fuel_type: str,
+        start_date: date,
+        end_date: date,
+        consumption: float,
+        units: str,
+        cost: float | None = None,
+    ) -> "UtilityBillData":
+        """Build a bill without running validation.
+
+        Intended for data that has already been validated, such as bills read back
+        from a database or copied from another ``UtilityBillData``. Inputs from users
+        or files should go through the regular constructor.
+
+        Returns:
+            UtilityBillData instance built via ``model_construct``
+        """
+        return cls.model_construct(
+            fuel_type=fuel_type,
+            start_date=start_date,
+            end_date=end_date,
+            consumption=consumption,
+            units=units,
+            cost=cost,
+        )
+
     def get_days(self) -> int:
         """Calculate number of days in billing period."""
         return (self.end_date - self.start_date).days
@@ -36,10 +63,8 @@ class UtilityBillData(BaseModel):
         Returns:
             Energy consumption in kWh
         """
-        fuel = normalize_fuel_type(self.fuel_type)
-        unit = normalize_fuel_unit(self.units)
-        factor = CONVERSION_TO_KWH.get((fuel, unit), 1.0)
-        return self.consumption * factor
+        factor = get_conversion_factor(self.fuel_type, self.units)
+        return self.consumption * (factor if factor is not None else 1.0)
 
     def calculate_daily_average(self) -> float:
         """Calculate average daily consumption.
@@ -1,7 +1,14 @@
 """Weather domain models."""
 
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
 from pydantic import BaseModel, Field
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class WeatherData(BaseModel):
     """Domain model for weather data with calculation methods."""
@@ -41,6 +48,25 @@ class WeatherData(BaseModel):
             return celsius_to_fahrenheit(self.max_temp_c)
         return None
 
+    @classmethod
+    def from_row_batch(cls, df: pd.DataFrame) -> list[WeatherData]:
+        """Build WeatherData records from a trusted DataFrame without validation.
+
+        Columns are matched to field names and extra columns are ignored. Missing
+        optional fields take their defaults and NaN values become ``None``. Only use
+        this for data that has already been validated upstream.
+
+        Args:
+            df: DataFrame with one row per station-month
+
+        Returns:
+            List of WeatherData objects, one per row
+        """
+        columns = [c for c in df.columns if c in cls.model_fields]
+        frame = df[columns].astype(object)
+        frame = frame.where(frame.notna(), None)
+        return [cls.model_construct(**row) for row in frame.to_dict("records")]
+
 
 class WeatherSeries(BaseModel):
     """Monthly weather time series aligned to calendar months."""
@@ -5,7 +5,9 @@ from .geography import (
     find_closest_weather_station,
     find_egrid_subregion,
     geocode,
+    haversine_cdist,
     haversine_distance,
+    haversine_distance_vec,
     is_valid_coordinates,
 )
 
@@ -14,6 +16,8 @@ __all__ = [
     "find_closest_weather_station",
     "find_egrid_subregion",
     "geocode",
+    "haversine_cdist",
     "haversine_distance",
+    "haversine_distance_vec",
     "is_valid_coordinates",
 ]
@@ -11,7 +11,9 @@ import logging
 import math
 
 import geocoder
+import numpy as np
 
+from better_lbnl_os._numba_compat import NUMBA_AVAILABLE, njit, prange
 from better_lbnl_os.models import LocationInfo
 
 logger = logging.getLogger(__name__)
@@ -61,6 +63,105 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return EARTH_RADIUS_KM * c
 
 
+def haversine_distance_rad(
+    lat1_rad: float,
+    lon1_rad: float,
+    lat2_rad: float,
+    lon2_rad: float,
+    cos_lat1: float,
+    cos_lat2: float,
+) -> float:
+    """Calculate the haversine distance from pre-converted radian coordinates.
+
+    Useful when the same point is compared repeatedly, so its radians and
+    latitude cosine can be computed once by the caller.
+
+    Args:
+        lat1_rad: Latitude of first point in radians
+        lon1_rad: Longitude of first point in radians
+        lat2_rad: Latitude of second point in radians
+        lon2_rad: Longitude of second point in radians
+        cos_lat1: Cosine of ``lat1_rad``
+        cos_lat2: Cosine of ``lat2_rad``
+
+    Returns:
+        Distance between the points in kilometers
+    """
+    a = (
+        math.sin((lat2_rad - lat1_rad) / 2) ** 2
+        + cos_lat1 * cos_lat2 * math.sin((lon2_rad - lon1_rad) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+def haversine_distance_vec(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Calculate haversine distances for arrays of coordinate points.
+
+    Vectorized counterpart of :func:`haversine_distance`. Inputs may be scalars
+    or array-likes that broadcast against each other, so one point can be
+    compared against many in a single call.
+
+    Args:
+        lat1: Latitude(s) of first point(s) in decimal degrees
+        lon1: Longitude(s) of first point(s) in decimal degrees
+        lat2: Latitude(s) of second point(s) in decimal degrees
+        lon2: Longitude(s) of second point(s) in decimal degrees
+
+    Returns:
+        Array of distances in kilometers with the broadcast shape of the inputs
+    """
+    lat1, lon1, lat2, lon2 = (
+        np.radians(np.asarray(v, dtype=float)) for v in (lat1, lon1, lat2, lon2)
+    )
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin(dlon / 2) ** 2
+
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+
+
+def haversine_cdist(points_a, points_b) -> np.ndarray:
+    """Calculate the pairwise haversine distance matrix between two point sets.
+
+    Args:
+        points_a: Array-like of shape (M, 2) with (latitude, longitude) rows
+        points_b: Array-like of shape (N, 2) with (latitude, longitude) rows
+
+    Returns:
+        Array of shape (M, N) where element [i, j] is the distance in kilometers
+        between ``points_a[i]`` and ``points_b[j]``
+    """
+    a = np.asarray(points_a, dtype=float).reshape(-1, 2)
+    b = np.asarray(points_b, dtype=float).reshape(-1, 2)
+    return haversine_distance_vec(a[:, 0, None], a[:, 1, None], b[None, :, 0], b[None, :, 1])
+
+
+if NUMBA_AVAILABLE:  # pragma: no cover - requires numba
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _haversine_one_to_many(lat0, lon0, lats, lons):
+        """Distances in km from one point to many, parallelised over the targets."""
+        out = np.empty(lats.shape[0])
+        lat0_rad = np.radians(lat0)
+        lon0_rad = np.radians(lon0)
+        cos_lat0 = np.cos(lat0_rad)
+        for i in prange(lats.shape[0]):
+            lat_rad = np.radians(lats[i])
+            dlat = lat_rad - lat0_rad
+            dlon = np.radians(lons[i]) - lon0_rad
+            a = np.sin(dlat / 2) ** 2 + cos_lat0 * np.cos(lat_rad) * np.sin(dlon / 2) ** 2
+            out[i] = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(a))
+        return out
+
+else:
+
+    def _haversine_one_to_many(lat0, lon0, lats, lons):
+        """Distances in km from one point to many (NumPy fallback)."""
+        return haversine_distance_vec(lat0, lon0, lats, lons)
+
+
 def is_valid_coordinates(latitude: float, longitude: float) -> bool:
     """Check if latitude and longitude coordinates are valid.
 
@@ -193,7 +294,7 @@ def geocode(address: str, api_key: str, weather_stations: list | None = None) ->
 
 def find_closest_weather_station(
     latitude: float, longitude: float, weather_stations: list
-) -> tuple[str, str]:
+) -> tuple[str | None, str | None]:
     """Find the closest weather station to given coordinates.
 
     Args:
@@ -203,26 +304,29 @@ def find_closest_weather_station(
                          'latitude', 'longitude', 'station_ID', 'station_name'
 
     Returns:
-        Tuple of (station_ID, station_name) for closest station
+        Tuple of (station_ID, station_name) for closest station; (None, None) if
+        no station has valid coordinates
     """
     if not weather_stations:
         raise ValueError("Weather stations list cannot be empty")
 
-    min_distance = float("inf")
-    closest_station_id = None
-    closest_station_name = None
+    n = len(weather_stations)
+    station_lats = np.fromiter((s["latitude"] for s in weather_stations), dtype=float, count=n)
+    station_lngs = np.fromiter((s["longitude"] for s in weather_stations), dtype=float, count=n)
 
-    for station in weather_stations:
-        distance = haversine_distance(
-            latitude, longitude, station["latitude"], station["longitude"]
-        )
-
-        if distance < min_distance:
-            min_distance = distance
-            closest_station_id = station["station_ID"]
-            closest_station_name = station["station_name"]
-
-    return closest_station_id, closest_station_name
+    distances = _haversine_one_to_many(
+        float(latitude), float(longitude), station_lats, station_lngs
+    )
+    # Stations with missing/invalid coordinates are never the closest (masked on the
+    # inputs, since the fastmath kernel need not propagate NaN)
+    valid = np.isfinite(station_lats) & np.isfinite(station_lngs) & np.isfinite(distances)
+    distances = np.where(valid, distances, np.inf)
+    best = int(np.argmin(distances))
+    if distances[best] == np.inf:
+        return None, None
+    closest = weather_stations[best]
+
+    return closest["station_ID"], closest["station_name"]
 
 
 # =============================================================================
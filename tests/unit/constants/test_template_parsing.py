@@ -0,0 +1,38 @@
+"""Unit tests for template header recognition."""
+
+from better_lbnl_os.constants.template_parsing import (
+    BETTER_BILLS_HEADERS,
+    BETTER_META_HEADERS,
+    canonical_bills_header,
+    canonical_meta_header,
+)
+
+
+def test_header_variants_are_tuples():
+    """Test that variant collections are immutable tuples."""
+    for spec in (BETTER_META_HEADERS, BETTER_BILLS_HEADERS):
+        assert all(isinstance(variants, tuple) for variants in spec.values())
+
+
+class TestCanonicalHeaders:
+    """Test variant -> canonical header lookups."""
+
+    def test_every_variant_is_recognized(self):
+        """Test that all declared variants resolve to their canonical key."""
+        for canonical, variants in BETTER_META_HEADERS.items():
+            for variant in variants:
+                assert canonical_meta_header(variant) == canonical
+        for canonical, variants in BETTER_BILLS_HEADERS.items():
+            for variant in variants:
+                assert canonical_bills_header(variant) == canonical
+
+    def test_whitespace_and_case_are_ignored(self):
+        """Test that surrounding whitespace and case do not affect matching."""
+        assert canonical_meta_header("  building name* ") == "BLDG_NAME"
+        assert canonical_bills_header("BILLING START DATE") == "START"
+
+    def test_unknown_header(self):
+        """Test that unrecognized headers return None."""
+        assert canonical_meta_header("Unnamed: 6") is None
+        assert canonical_bills_header("Energy Type (kWh)") is None
+
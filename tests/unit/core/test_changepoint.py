@@ -6,11 +6,16 @@ import numpy as np
 import pytest
 
 from better_lbnl_os.core.changepoint import (
+    _fit_changepoint_model_cached,
+    _make_5p_fit_function,
+    _piecewise_linear_5p_fit,
     _validate_model_inputs,
     calculate_cvrmse,
     calculate_r_squared,
     fit_changepoint_model,
     piecewise_linear_5p,
+    piecewise_linear_5p_jac,
+    warm_up,
 )
 from better_lbnl_os.models import ChangePointModelResult
 
@@ -50,6 +55,15 @@ class TestChangePointModeling:
         with pytest.raises(ValueError, match="cannot be all NaN"):
             _validate_model_inputs(temperature, energy_use)
 
+    def test_validate_inputs_non_finite_values(self):
+        """Test input validation rejects partial NaN or infinite values."""
+        temperature = np.array([10.0, 20.0, 30.0])
+
+        with pytest.raises(ValueError, match="must be finite"):
+            _validate_model_inputs(temperature, np.array([100.0, np.nan, 80.0]))
+        with pytest.raises(ValueError, match="must be finite"):
+            _validate_model_inputs(np.array([10.0, np.inf, 30.0]), np.array([100, 90, 80]))
+
 
 class TestPiecewiseLinearFunction:
     """Test suite for the 5-parameter piecewise linear function."""
@@ -120,6 +134,46 @@ class TestPiecewiseLinearFunction:
         expected_cooling = cooling_slope * 35 + baseload - cooling_slope * cooling_changepoint
         assert abs(result[4] - expected_cooling) < 1e-10
 
+    def test_fit_kernel_matches_model(self):
+        """Test the fitter's model kernel (compiled when numba is present) matches exactly."""
+        x = np.linspace(-5.0, 35.0, 41)
+        params = (-1.5, 11.0, 60.0, 21.0, 2.5)
+
+        np.testing.assert_array_equal(
+            _piecewise_linear_5p_fit(x, *params), piecewise_linear_5p(x, *params)
+        )
+
+    def test_fit_function_matches_model_across_calls(self):
+        """Test the fitter's buffered model function stays exact on repeated calls."""
+        x = np.linspace(-5.0, 35.0, 41)
+        model = _make_5p_fit_function(x.size)
+
+        for params in [(-1.5, 11.0, 60.0, 21.0, 2.5), (-0.5, 25.0, 40.0, 15.0, 1.0)]:
+            np.testing.assert_array_equal(
+                np.array(model(x, *params)), piecewise_linear_5p(x, *params)
+            )
+
+    def test_warm_up(self):
+        """Test the kernel warm-up runs without inputs."""
+        assert warm_up() is None
+
+    def test_5p_jacobian_matches_finite_differences(self):
+        """Test analytical Jacobian against central differences away from the kinks."""
+        x = np.array([2.0, 7.5, 14.0, 19.0, 23.5, 31.0])
+        params = np.array([-1.5, 11.0, 60.0, 21.0, 2.5])
+        eps = 1e-6
+
+        jac = piecewise_linear_5p_jac(x, *params)
+
+        assert jac.shape == (x.size, 5)
+        for k in range(5):
+            step = np.zeros(5)
+            step[k] = eps
+            numeric = (
+                piecewise_linear_5p(x, *(params + step)) - piecewise_linear_5p(x, *(params - step))
+            ) / (2 * eps)
+            np.testing.assert_allclose(jac[:, k], numeric, atol=1e-6)
+
 
 class TestStatisticalFunctions:
     """Test suite for statistical calculation functions."""
@@ -222,6 +276,84 @@ class TestChangePointModelIntegration:
         assert result.heating_slope < 0  # Should be negative for heating
         assert result.r_squared > 0.8  # Should have good fit
 
+    def test_parallel_sweep_matches_serial(self):
+        """Test that fitting the bounds sweep in worker processes gives the same model."""
+        rng = np.random.default_rng(7)
+        temperature = rng.uniform(-5, 32, 240)
+        energy_use = piecewise_linear_5p(temperature, -0.05, 10.0, 1.0, 22.0, 0.04)
+        energy_use = energy_use + rng.normal(0, 0.02, temperature.size)
+
+        serial = fit_changepoint_model(temperature, energy_use)
+        parallel = fit_changepoint_model(temperature, energy_use, n_jobs=2)
+
+        assert parallel == serial
+
+    @pytest.mark.parametrize("n_jobs", [0, -2])
+    def test_invalid_n_jobs_raises(self, n_jobs):
+        """Test that n_jobs other than -1 or a positive integer is rejected."""
+        temperature = np.linspace(0, 30, 12)
+        energy_use = 2.0 * temperature + 5.0
+        with pytest.raises(ValueError, match="n_jobs must be -1"):
+            fit_changepoint_model(temperature, energy_use, n_jobs=n_jobs)
+
+    def test_repeated_fit_is_memoized(self):
+        """Test that refitting identical arrays reuses the cached fit but returns a copy."""
+        temperature = np.linspace(0, 30, 12)
+        energy_use = piecewise_linear_5p(temperature, None, None, 50.0, 18.0, 2.0) + np.tile(
+            [0.5, -0.5], 6
+        )
+
+        first = fit_changepoint_model(temperature, energy_use)
+        hits = _fit_changepoint_model_cached.cache_info().hits
+        second = fit_changepoint_model(temperature.copy(), energy_use.copy())
+
+        assert _fit_changepoint_model_cached.cache_info().hits == hits + 1
+        assert second == first
+        assert second is not first
+
+    def test_early_stop_accepts_first_good_fit(self):
+        """Test that stop_r_squared ends the sweep on a good fit and is off by default."""
+        temperature = np.linspace(0, 30, 12)
+        energy_use = piecewise_linear_5p(temperature, 12.0, -3.0, 50.0, 18.0, 2.0) + np.tile(
+            [0.5, -0.5], 6
+        )
+
+        full = fit_changepoint_model(temperature, energy_use)
+        early = fit_changepoint_model(temperature, energy_use, stop_r_squared=0.9)
+
+        assert full == fit_changepoint_model(temperature, energy_use, stop_r_squared=None)
+        assert early.r_squared >= 0.9
+        assert early.r_squared <= full.r_squared
+
+    def test_parallel_sweep_honors_early_stop(self):
+        """Test that a parallel sweep stops at the same box as the serial one."""
+        rng = np.random.default_rng(7)
+        temperature = rng.uniform(-5, 32, 240)
+        energy_use = piecewise_linear_5p(temperature, -0.05, 10.0, 1.0, 22.0, 0.04)
+        energy_use = energy_use + rng.normal(0, 0.02, temperature.size)
+
+        full = fit_changepoint_model(temperature, energy_use, n_jobs=2)
+        serial = fit_changepoint_model(temperature, energy_use, stop_r_squared=0.9)
+        parallel = fit_changepoint_model(temperature, energy_use, n_jobs=2, stop_r_squared=0.9)
+
+        assert parallel == serial
+        assert parallel != full
+
+    def test_fit_does_not_depend_on_input_order(self):
+        """Test that shuffled observations give the same model as sorted ones."""
+        temperature = np.linspace(0, 30, 12)
+        energy_use = piecewise_linear_5p(temperature, -3.0, 12.0, 50.0, 18.0, 2.0) + np.tile(
+            [0.5, -0.5], 6
+        )
+        order = np.random.default_rng(0).permutation(len(temperature))
+
+        ordered = fit_changepoint_model(temperature, energy_use)
+        shuffled = fit_changepoint_model(temperature[order], energy_use[order])
+
+        assert shuffled.model_type == ordered.model_type
+        assert shuffled.r_squared == pytest.approx(ordered.r_squared, rel=1e-6)
+        assert shuffled.heating_pvalue == pytest.approx(ordered.heating_pvalue, rel=1e-6)
+
     def test_fit_model_insufficient_data(self):
         """Test behavior with insufficient data points."""
         temperature = np.array([20])  # Only one point
@@ -6,6 +6,7 @@ from better_lbnl_os.core import defaults
 def test_normalize_state_code_handles_abbreviation_and_full_name():
     assert defaults.normalize_state_code("ca") == "CA"
     assert defaults.normalize_state_code("California") == "CA"
+    assert defaults.normalize_state_code(" new hampshire ") == "NH"
     assert defaults.normalize_state_code("   ") is None
     assert defaults.normalize_state_code("unknown") is None
     assert defaults.normalize_state_code(None) is None
@@ -0,0 +1,188 @@
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import ClassVar
+
+import pytest
+
+from better_lbnl_os.core import pipeline
+from better_lbnl_os.models import LocationInfo, UtilityBillData, WeatherData
+
+
+class _FakeProvider:
+    calls: ClassVar[list[tuple]] = []
+
+    def __init__(self, api_key: str):
+        self.api_key = api_key
+
+    def geocode(self, address: str) -> LocationInfo:
+        self.calls.append(("geocode", self.api_key, address))
+        return LocationInfo(geo_lat=37.87, geo_lng=-122.27, zipcode="94704", country_code="US")
+
+    def reverse_geocode(self, latitude: float, longitude: float) -> LocationInfo:
+        self.calls.append(("reverse", self.api_key, latitude, longitude))
+        return LocationInfo(geo_lat=latitude, geo_lng=longitude, country_code="US")
+
+
+@pytest.fixture
+def fake_provider(monkeypatch):
+    _FakeProvider.calls = []
+    pipeline._GEOCODE_CACHE.clear()
+    monkeypatch.setattr(pipeline, "GoogleMapsGeocodingProvider", _FakeProvider)
+    yield _FakeProvider
+    pipeline._GEOCODE_CACHE.clear()
+
+
+def test_resolve_location_geocodes_each_address_once(fake_provider):
+    first = pipeline.resolve_location(address="Berkeley, CA", google_maps_api_key="key")
+    again = pipeline.resolve_location(address="  berkeley, ca ", google_maps_api_key="key")
+
+    assert fake_provider.calls == [("geocode", "key", "Berkeley, CA")]
+    assert again == first
+    assert again is not first
+
+    pipeline.resolve_location(latitude=1, longitude=2, google_maps_api_key="key")
+    pipeline.resolve_location(latitude=1.0, longitude=2.0, google_maps_api_key="key")
+    pipeline.resolve_location(address="Berkeley, CA", google_maps_api_key="other")
+    assert len(fake_provider.calls) == 3
+
+
+def test_geocode_cache_evicts_oldest_entry(fake_provider, monkeypatch):
+    monkeypatch.setattr(pipeline, "_GEOCODE_CACHE_MAXSIZE", 2)
+    for address in ("A St", "B St", "C St", "B St", "A St"):
+        pipeline.resolve_location(address=address, google_maps_api_key="key")
+
+    assert [call[2] for call in fake_provider.calls] == ["A St", "B St", "C St", "A St"]
+    assert len(pipeline._GEOCODE_CACHE) == 2
+
+
+def test_geocode_cache_is_thread_safe(fake_provider, monkeypatch):
+    monkeypatch.setattr(pipeline, "_GEOCODE_CACHE_MAXSIZE", 4)
+    # Switch threads often so concurrent misses interleave inside the eviction
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    addresses = [f"{i} Main St" for i in range(20000)]
+
+    def resolve(address):
+        return pipeline.resolve_location(address=address, google_maps_api_key="key")
+
+    try:
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(resolve, addresses))
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert len(results) == len(addresses)
+    assert len(pipeline._GEOCODE_CACHE) <= 4
+
+
+def test_resolve_location_validates_inputs(fake_provider):
+    with pytest.raises(ValueError, match="google_maps_api_key"):
+        pipeline.resolve_location(address="Berkeley, CA")
+    with pytest.raises(ValueError, match="Either coordinates or address"):
+        pipeline.resolve_location(google_maps_api_key="key")
+    with pytest.raises(ValueError, match="Invalid address"):
+        pipeline.resolve_location(address=["Berkeley"], google_maps_api_key="key")
+    assert fake_provider.calls == []
+
+
+def test_get_weather_for_bills_reuses_fetched_range(fake_provider, monkeypatch):
+    fetches = []
+
+    class _FakeWeatherService:
+        def __init__(self, provider):
+            self.provider = provider
+
+        def get_weather_range(self, location, start_year, start_month, end_year, end_month):
+            fetches.append((location.geo_lat, start_year, start_month, end_year, end_month))
+            if location.geo_lat < 0:
+                return []
+            months = [(start_year, m) for m in range(start_month, end_month + 1)]
+            if location.geo_lat < 1:
+                months = months[:-1]  # month-by-month fallback lost a month
+            return [
+                WeatherData(
+                    latitude=location.geo_lat,
+                    longitude=location.geo_lng,
+                    year=year,
+                    month=month,
+                    avg_temp_c=10.0,
+                )
+                for year, month in months
+            ]
+
+    pipeline._WEATHER_CACHE.clear()
+    monkeypatch.setattr(pipeline, "WeatherService", _FakeWeatherService)
+    bills = [
+        UtilityBillData(
+            fuel_type="ELECTRICITY",
+            start_date=date(2023, 1, 5),
+            end_date=date(2023, 3, 2),
+            consumption=100,
+            units="kWh",
+        )
+    ]
+
+    first = pipeline.get_weather_for_bills(bills, address="Berkeley, CA", google_maps_api_key="k")
+    again = pipeline.get_weather_for_bills(bills, address="Berkeley, CA", google_maps_api_key="k")
+
+    assert fetches == [(37.87, 2023, 1, 2023, 3)]
+    assert again == first
+    assert again[0] is not first[0]
+
+    # Empty and partial (failed) fetches are retried rather than cached
+    for _ in range(2):
+        assert (
+            pipeline.get_weather_for_bills(
+                bills, latitude=-1.0, longitude=2.0, google_maps_api_key="k"
+            )
+            == []
+        )
+        partial = pipeline.get_weather_for_bills(
+            bills, latitude=0.5, longitude=2.0, google_maps_api_key="k"
+        )
+        assert [w.month for w in partial] == [1, 2]
+    assert len(fetches) == 5
+
+    # Ranges reaching the current month are still changing and are not cached
+    month_start = date.today().replace(day=1)
+    recent = [
+        bills[0].model_copy(
+            update={"start_date": month_start, "end_date": month_start.replace(day=2)}
+        )
+    ]
+    for _ in range(2):
+        pipeline.get_weather_for_bills(recent, address="Berkeley, CA", google_maps_api_key="k")
+    assert len(fetches) == 7
+    pipeline._WEATHER_CACHE.clear()
+
+
+def test_fit_models_from_inputs_lean_path_matches_typed():
+    bills, weather = [], []
+    for i in range(24):
+        year, month = 2022 + i // 12, i % 12 + 1
+        temp = 12.0 + 10.0 * (-1) ** (month // 7) * (month % 6) / 5
+        weather.append(
+            WeatherData(latitude=0.0, longitude=0.0, year=year, month=month, avg_temp_c=temp)
+        )
+        end = date(year + month // 12, month % 12 + 1, 1)
+        bills.append(
+            UtilityBillData(
+                fuel_type="ELECTRICITY",
+                start_date=date(year, month, 1),
+                end_date=end,
+                consumption=9000 + 400 * max(temp - 15.0, 0) + 37 * (i % 5),
+                units="kWh",
+            )
+        )
+
+    typed = pipeline.fit_models_from_inputs(bills, 1000.0, weather)
+    lean = pipeline.fit_models_from_inputs(bills, 1000.0, weather, use_typed=False)
+
+    assert list(lean) == list(typed) == ["ELECTRICITY"]
+    assert lean["ELECTRICITY"].model_type == typed["ELECTRICITY"].model_type
+    assert lean["ELECTRICITY"].r_squared == pytest.approx(typed["ELECTRICITY"].r_squared)
+
+
+def test_warm_up_kernels():
+    assert pipeline.warm_up_kernels() is None
@@ -2,9 +2,15 @@
 
 from datetime import date
 
+import pytest
+
+from better_lbnl_os.constants import CONVERSION_TO_KWH
 from better_lbnl_os.core.preprocessing import (
     CalendarizationOptions,
+    calendarize_monthly_eui,
     calendarize_utility_bills,
+    nonzero_bounds,
+    trim_series,
 )
 from better_lbnl_os.models import UtilityBillData, WeatherData
 from better_lbnl_os.models.utility_bills import CalendarizedData
@@ -95,3 +101,73 @@ def test_calendarize_with_gas_conversion_and_emissions():
     # Emissions present (kg CO2): kWh * factor
     ghg = res.aggregated.ghg_kg["FOSSIL_FUEL"][0]
     assert round(ghg, 2) == round(1000 * 29.307 * 0.18, 2)
+
+
+def test_default_options_share_conversion_table():
+    # Keeping the shared table (not a copy) lets convert_to_kwh use its prebuilt LUT
+    assert CalendarizationOptions().conversion_to_kwh is CONVERSION_TO_KWH
+
+
+def test_calendarize_splits_bill_across_months_by_day():
+    bills = [
+        UtilityBillData(
+            fuel_type="ELECTRICITY",
+            start_date=date(2023, 1, 17),
+            end_date=date(2023, 2, 15),
+            consumption=6000,
+            units="kWh",
+        ),
+    ]
+
+    res = calendarize_utility_bills(bills, floor_area=1000.0)
+
+    # 15 of the 30 billed days fall in each month
+    assert [m.month for m in res.aggregated.months] == [1, 2]
+    assert res.aggregated.energy_kwh["ELECTRICITY"] == [3000.0, 3000.0]
+    assert res.aggregated.days_in_period == [31, 28]
+
+
+def test_calendarize_monthly_eui_matches_full_calendarization():
+    def bill(fuel, units, start, end, consumption):
+        return UtilityBillData(
+            fuel_type=fuel, start_date=start, end_date=end, consumption=consumption, units=units
+        )
+
+    bills = [
+        bill("ELECTRICITY", "kWh", date(2023, 1, 17), date(2023, 2, 15), 6000),
+        bill("ELECTRICITY", "kWh", date(2023, 2, 15), date(2023, 3, 20), 5000),
+        bill("NATURAL_GAS", "therms", date(2023, 1, 5), date(2023, 2, 4), 300),
+        # Overlaps the gas bill; both map to FOSSIL_FUEL
+        bill("FUEL_OIL_2", "Gallons (US)", date(2023, 1, 20), date(2023, 2, 10), 40),
+    ]
+    weather = [
+        WeatherData(latitude=0.0, longitude=0.0, year=2023, month=1, avg_temp_c=4.0),
+        WeatherData(latitude=0.0, longitude=0.0, year=2023, month=3, avg_temp_c=11.0),
+    ]
+
+    full = calendarize_utility_bills(bills, floor_area=1000.0, weather=weather).to_legacy_dict()
+    lean = calendarize_monthly_eui(bills, floor_area=1000.0, weather=weather)
+
+    assert lean["weather"] == full["weather"]
+    for key in ("periods", "days_in_period"):
+        assert lean["aggregated"][key] == full["aggregated"][key]
+    eui = full["aggregated"]["dict_v_eui"]
+    assert list(lean["aggregated"]["dict_v_eui"]) == list(eui) == ["ELECTRICITY", "FOSSIL_FUEL"]
+    for et, values in eui.items():
+        assert lean["aggregated"]["dict_v_eui"][et] == pytest.approx(values, rel=1e-12)
+
+    assert calendarize_monthly_eui(bills, floor_area=0.0)["aggregated"]["dict_v_eui"] == {}
+    assert calendarize_monthly_eui([], floor_area=1000.0)["aggregated"]["periods"] == []
+
+
+def test_trim_series_drops_leading_and_trailing_zeros():
+    eui = [0.0, 0.0, 1.5, 0.0, 2.0, 0.0]
+    degc = [1.0, 2.0, 3.0, 4.0, 5.0, 6.0]
+
+    assert nonzero_bounds(eui) == (2, 5)
+    assert trim_series(eui, degc) == ([1.5, 0.0, 2.0], [3.0, 4.0, 5.0])
+
+    assert nonzero_bounds([0.0, 0.0]) == (0, 0)
+    assert trim_series([0.0, 0.0], [1.0, 2.0]) == ([], [])
+    # Mismatched lengths are returned unchanged
+    assert trim_series([0.0, 1.0], [1.0]) == ([0.0, 1.0], [1.0])
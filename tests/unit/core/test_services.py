@@ -93,3 +93,26 @@ def test_portfolio_benchmark_service_aggregates_results():
     report = portfolio.generate_portfolio_report()
     assert report["metrics"] == metrics
     assert "report_date" in report
+
+
+def test_portfolio_targets_keep_insertion_order_on_ties():
+    portfolio = PortfolioBenchmarkService()
+    building = _sample_building()
+    for building_id, percentile in [("B1", 70.0), ("B2", 90.0), ("B3", 70.0), ("B4", 10.0)]:
+        portfolio.add_building(
+            building, SimpleNamespace(building_id=building_id, percentile=percentile, rating="X")
+        )
+
+    assert portfolio.identify_improvement_targets(3) == ["B2", "B1", "B3"]
+    assert portfolio.identify_improvement_targets(10) == ["B2", "B1", "B3", "B4"]
+
+    # Results appended directly still feed the metrics
+    portfolio.results.append(SimpleNamespace(building_id="B5", percentile=60.0, rating="Y"))
+    metrics = portfolio.calculate_portfolio_metrics()
+    assert metrics["average_percentile"] == pytest.approx(60.0)
+    assert metrics["rating_distribution"] == {"X": 4, "Y": 1}
+
+    # In-place replacement keeps the length but must still be picked up
+    portfolio.results[1] = SimpleNamespace(building_id="B2", percentile=0.0, rating="Z")
+    assert portfolio.calculate_portfolio_metrics()["average_percentile"] == pytest.approx(42.0)
+    assert portfolio.identify_improvement_targets(2) == ["B1", "B3"]
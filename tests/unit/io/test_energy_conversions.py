@@ -1,10 +1,16 @@
 from datetime import date
 
+import numpy as np
+import pandas as pd
 import pytest
 
 from better_lbnl_os.constants.energy import (
+    CONVERSION_TABLES,
+    CONVERSION_TO_KWH,
     FuelType,
     FuelUnit,
+    convert_to_kwh,
+    factor_lut,
     get_conversion_factor,
     normalize_fuel_type,
     normalize_fuel_unit,
@@ -32,6 +38,61 @@ def test_get_conversion_factor_matches_expected():
     assert factor == pytest.approx(42.788, rel=1e-6)
 
 
+def test_conversion_table_is_read_only():
+    with pytest.raises(TypeError):
+        CONVERSION_TO_KWH[("NATURAL_GAS", "THERMS")] = 1.0
+
+
+def test_convert_to_kwh_vectorized_matches_scalar_lookup():
+    df = pd.DataFrame(
+        {
+            "fuel": ["Electric - Grid", "Natural Gas", "Fuel Oil (No. 4)", "Natural Gas", None],
+            "unit": ["kWh", "therms", "Gallons (US)", "blobs", "kWh"],
+            "qty": [100.0, 10.0, 2.0, 5.0, 1.0],
+        }
+    )
+
+    result = convert_to_kwh(df, "fuel", "unit", "qty")
+
+    assert result[0] == pytest.approx(100.0)
+    assert result[1] == pytest.approx(10.0 * get_conversion_factor("Natural Gas", "therms"))
+    assert result[2] == pytest.approx(2.0 * 42.788)
+    assert np.isnan(result[3])
+    assert np.isnan(result[4])
+
+
+def test_conversion_table_only_has_canonical_keys():
+    pairs = {(fuel.value, unit.value) for fuel in FuelType for unit in FuelUnit}
+    assert set(CONVERSION_TO_KWH) <= pairs
+    assert len(CONVERSION_TO_KWH) == sum(len(units) for units in CONVERSION_TABLES.values())
+
+
+def test_factor_lut_matches_conversion_table():
+    lut = factor_lut()
+    fuels, units = list(FuelType), list(FuelUnit)
+
+    assert lut.shape == (len(fuels), len(units))
+    assert not lut.flags.writeable
+    for i, fuel in enumerate(fuels):
+        for j, unit in enumerate(units):
+            factor = CONVERSION_TO_KWH.get((fuel.value, unit.value))
+            if factor is None:
+                assert np.isnan(lut[i, j])
+            else:
+                assert lut[i, j] == factor
+
+
+def test_convert_to_kwh_custom_table():
+    df = pd.DataFrame(
+        {"fuel": ["Natural Gas", "Natural Gas"], "unit": ["therms", "kWh"], "qty": [2.0, 3.0]}
+    )
+
+    result = convert_to_kwh(df, "fuel", "unit", "qty", {("NATURAL_GAS", "THERMS"): 30.0})
+
+    assert result[0] == pytest.approx(60.0)
+    assert np.isnan(result[1])
+
+
 def test_calendarization_converts_complex_units():
     bills = [
         UtilityBillData(
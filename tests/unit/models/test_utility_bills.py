@@ -47,6 +47,22 @@ class TestUtilityBillData:
         )
         assert abs(bill_gas.to_kwh() - 2930.7) < 0.1  # 100 therms * 29.307 kWh/therm
 
+    def test_from_trusted_matches_validated(self):
+        """Test the unvalidated constructor yields an equivalent bill."""
+        kwargs = {
+            "fuel_type": "NATURAL_GAS",
+            "start_date": date(2024, 1, 1),
+            "end_date": date(2024, 1, 31),
+            "consumption": 100.0,
+            "units": "therms",
+        }
+
+        trusted = UtilityBillData.from_trusted(**kwargs)
+
+        assert trusted == UtilityBillData(**kwargs)
+        assert trusted.cost is None
+        assert trusted.get_days() == 30
+
     def test_get_days(self):
         """Test billing period day calculation."""
         bill = UtilityBillData(
@@ -3,6 +3,9 @@
 import calendar
 import unittest
 
+import numpy as np
+import pandas as pd
+
 from better_lbnl_os.models import WeatherData, WeatherStation
 from better_lbnl_os.utils.calculations import (
     validate_temperature_range,
@@ -151,6 +154,29 @@ class TestWeatherDataModel(unittest.TestCase):
                 data_source="Test",
             )
 
+    def test_from_row_batch(self):
+        """Test bulk construction from a trusted DataFrame."""
+        df = pd.DataFrame(
+            {
+                "latitude": [37.8716, 37.8716],
+                "longitude": [-122.2727, -122.2727],
+                "year": [2024, 2024],
+                "month": [1, 2],
+                "avg_temp_c": [10.0, 12.5],
+                "min_temp_c": [5.0, np.nan],
+                "unrelated": ["x", "y"],
+            }
+        )
+
+        records = WeatherData.from_row_batch(df)
+
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[1].month, 2)
+        self.assertAlmostEqual(records[1].avg_temp_f, 54.5)
+        self.assertEqual(records[0].min_temp_c, 5.0)
+        self.assertIsNone(records[1].min_temp_c)
+        self.assertEqual(records[0].data_source, "OpenMeteo")
+
 
 class TestWeatherStationModel(unittest.TestCase):
     """Test WeatherStation domain model."""
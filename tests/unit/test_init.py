@@ -0,0 +1,47 @@
+"""Tests for the lazy top-level package exports."""
+
+import ast
+import inspect
+
+import pytest
+
+import better_lbnl_os
+
+
+def test_all_public_names_resolve():
+    for name in better_lbnl_os.__all__:
+        assert getattr(better_lbnl_os, name) is not None
+
+
+def test_all_has_no_duplicates_and_covers_version_info():
+    assert len(better_lbnl_os.__all__) == len(set(better_lbnl_os.__all__))
+    assert {"__version__", "__author__", "__email__"} <= set(better_lbnl_os.__all__)
+
+
+def test_lazy_export_matches_source_module():
+    from better_lbnl_os.core.changepoint import fit_changepoint_model
+
+    assert better_lbnl_os.fit_changepoint_model is fit_changepoint_model
+    assert "fit_changepoint_model" in dir(better_lbnl_os)
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="no attribute 'not_a_real_name'"):
+        better_lbnl_os.not_a_real_name  # noqa: B018
+
+
+def test_type_checking_imports_match_lazy_table():
+    tree = ast.parse(inspect.getsource(better_lbnl_os))
+    block = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and getattr(node.test, "id", None) == "TYPE_CHECKING"
+    )
+    static = {
+        alias.name: stmt.module
+        for stmt in block.body
+        if isinstance(stmt, ast.ImportFrom)
+        for alias in stmt.names
+    }
+
+    assert static == better_lbnl_os._LAZY
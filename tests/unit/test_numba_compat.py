@@ -0,0 +1,20 @@
+"""Tests for the optional numba shim."""
+
+from better_lbnl_os._numba_compat import NUMBA_AVAILABLE, njit, prange
+
+
+def test_njit_supports_bare_and_configured_use():
+    @njit
+    def add(a, b):
+        return a + b
+
+    @njit(cache=False)
+    def total(n):
+        acc = 0
+        for i in prange(n):
+            acc += i
+        return acc
+
+    assert add(2, 3) == 5
+    assert total(4) == 6
+    assert isinstance(NUMBA_AVAILABLE, bool)
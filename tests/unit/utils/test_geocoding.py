@@ -4,6 +4,7 @@ Tests for geocoding algorithms.
 
 from unittest.mock import Mock, patch
 
+import numpy as np
 import pytest
 
 from better_lbnl_os.models import LocationInfo
@@ -13,6 +14,9 @@ from better_lbnl_os.utils.geography import (
     find_closest_weather_station,
     find_egrid_subregion,
     geocode,
+    haversine_cdist,
+    haversine_distance,
+    haversine_distance_vec,
 )
 
 
@@ -127,6 +131,26 @@ class TestWeatherStationFinder:
         assert station_id == "SFO"
         assert station_name == "San Francisco International Airport"
 
+    def test_find_closest_weather_station_skips_nan_coordinates(self):
+        """Test that stations with NaN coordinates are never picked."""
+        weather_stations = [
+            {
+                "latitude": float("nan"),
+                "longitude": -122.4,
+                "station_ID": "BAD",
+                "station_name": "Bad",
+            },
+            {
+                "latitude": 38.5816,
+                "longitude": -121.4944,
+                "station_ID": "SAC",
+                "station_name": "Sac",
+            },
+        ]
+
+        assert find_closest_weather_station(37.8, -122.4, weather_stations) == ("SAC", "Sac")
+        assert find_closest_weather_station(37.8, -122.4, weather_stations[:1]) == (None, None)
+
     def test_find_closest_weather_station_empty_list(self):
         """Test finding weather station with empty stations list."""
         latitude = 37.7749
@@ -137,6 +161,36 @@ class TestWeatherStationFinder:
             find_closest_weather_station(latitude, longitude, weather_stations)
 
 
+class TestVectorizedHaversine:
+    """Test suite for array-based haversine distance functions."""
+
+    def test_haversine_distance_vec_matches_scalar(self):
+        """Test vectorized distances agree with the scalar implementation."""
+        lats = np.array([34.0522, 40.7128, 37.7749])
+        lngs = np.array([-118.2437, -74.0060, -122.4194])
+
+        result = haversine_distance_vec(37.7749, -122.4194, lats, lngs)
+
+        expected = [
+            haversine_distance(37.7749, -122.4194, la, lo)
+            for la, lo in zip(lats, lngs, strict=True)
+        ]
+        np.testing.assert_allclose(result, expected)
+        assert result[2] == pytest.approx(0.0)
+
+    def test_haversine_cdist_shape_and_values(self):
+        """Test pairwise distance matrix between two point sets."""
+        points_a = [(37.7749, -122.4194), (34.0522, -118.2437)]
+        points_b = [(40.7128, -74.0060), (37.7749, -122.4194), (47.6062, -122.3321)]
+
+        matrix = haversine_cdist(points_a, points_b)
+
+        assert matrix.shape == (2, 3)
+        for i, (la1, lo1) in enumerate(points_a):
+            for j, (la2, lo2) in enumerate(points_b):
+                assert matrix[i, j] == pytest.approx(haversine_distance(la1, lo1, la2, lo2))
+
+
 class TestEGridMapping:
     """Test suite for eGrid subregion mapping functionality."""
 
@@ -249,7 +303,10 @@ class TestLocationInfo:
 
         # Invalid coordinates
         invalid_location = LocationInfo(
-            geo_lat=200.0, geo_lng=-122.4194, zipcode="94102", country_code="US"  # Invalid latitude
+            geo_lat=200.0,
+            geo_lng=-122.4194,
+            zipcode="94102",
+            country_code="US",  # Invalid latitude
         )
         assert not invalid_location.is_valid_coordinates()
 
@@ -263,6 +320,19 @@ class TestLocationInfo:
 
         # Distance between SF and LA should be approximately 560km
         assert 500 < distance < 600
+        assert distance == pytest.approx(haversine_distance(37.7749, -122.4194, 34.0522, -118.2437))
+
+    def test_location_distance_after_coordinate_update(self):
+        """Test distance follows coordinate changes."""
+        sf = LocationInfo(geo_lat=37.7749, geo_lng=-122.4194, zipcode="94102", country_code="US")
+        la = LocationInfo(geo_lat=34.0522, geo_lng=-118.2437, zipcode="90210", country_code="US")
+        assert sf.calculate_distance_to(la) > 500
+
+        moved = sf.model_copy(update={"geo_lat": 34.0522, "geo_lng": -118.2437})
+        assert moved.calculate_distance_to(la) == pytest.approx(0.0)
+
+        sf.geo_lat, sf.geo_lng = la.geo_lat, la.geo_lng
+        assert sf.calculate_distance_to(la) == pytest.approx(0.0)
 
 
 if __name__ == "__main__":